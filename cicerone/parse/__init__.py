@@ -1,6 +1,7 @@
 """Parser utilities for OpenAPI specifications."""
 
 from cicerone.parse.parser import (
+    clear_cache,
     parse_spec_from_dict,
     parse_spec_from_file,
     parse_spec_from_json,
@@ -9,6 +10,7 @@ from cicerone.parse.parser import (
 )
 
 __all__ = [
+    "clear_cache",
     "parse_spec_from_dict",
     "parse_spec_from_file",
     "parse_spec_from_json",
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import collections
+import gzip
 import json
 import pathlib
+import threading
 import typing
+from urllib import error as urllib_error
 from urllib import request as urllib_request
 
 import yaml
@@ -19,6 +23,63 @@ from cicerone.spec import tag as spec_tag
 from cicerone.spec import version as spec_version
 from cicerone.spec import webhooks as spec_webhooks
 
+# orjson is an optional speedup: it parses JSON several times faster than the
+# standard library and accepts bytes directly, so we can skip decoding to str.
+try:
+    import orjson  # ty: ignore[unresolved-import]
+
+    _JSON_LOADS: typing.Callable[[str | bytes], typing.Any] = orjson.loads
+except ImportError:
+    _JSON_LOADS = json.loads
+
+# Use the libyaml-backed loader when PyYAML was built with it; it is roughly an
+# order of magnitude faster than the pure-Python SafeLoader on large specs.
+_YAML_LOADER: typing.Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Recently parsed specs, used when parse_spec_from_file() / parse_spec_from_url() are called with cache=True.
+# Files are keyed by resolved path and validated against (mtime, size);
+# URLs are keyed by URL and revalidated with their ETag / Last-Modified headers.
+# Both caches are guarded by _CACHE_LOCK so they can be used from several threads.
+_CACHE_MAX_SIZE = 32
+_CACHE_LOCK = threading.Lock()
+_FILE_CACHE: collections.OrderedDict[str, tuple[tuple[int, int], spec_openapi.OpenAPISpec]] = collections.OrderedDict()
+_URL_CACHE: collections.OrderedDict[str, tuple[dict[str, str], spec_openapi.OpenAPISpec]] = collections.OrderedDict()
+
+
+def _cache_get(cache: collections.OrderedDict[str, typing.Any], key: str) -> typing.Any | None:
+    """Return a cached entry, marking it as most recently used."""
+    with _CACHE_LOCK:
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+        return entry
+
+
+def _cache_put(cache: collections.OrderedDict[str, typing.Any], key: str, entry: typing.Any) -> None:
+    """Store a cache entry, evicting the least recently used one when full."""
+    with _CACHE_LOCK:
+        cache[key] = entry
+        cache.move_to_end(key)
+        if len(cache) > _CACHE_MAX_SIZE:
+            cache.popitem(last=False)
+
+
+def _cache_discard(cache: collections.OrderedDict[str, typing.Any], key: str) -> None:
+    """Remove a cache entry if present."""
+    with _CACHE_LOCK:
+        cache.pop(key, None)
+
+
+def clear_cache() -> None:
+    """Forget all specs cached by parse_spec_from_file() and parse_spec_from_url().
+
+    Example:
+        >>> clear_cache()
+    """
+    with _CACHE_LOCK:
+        _FILE_CACHE.clear()
+        _URL_CACHE.clear()
+
 
 def parse_spec_from_dict(data: typing.Mapping[str, typing.Any]) -> spec_openapi.OpenAPISpec:
     """Create an OpenAPISpec from a dictionary.
@@ -35,7 +96,7 @@ def parse_spec_from_dict(data: typing.Mapping[str, typing.Any]) -> spec_openapi.
     """
     # Detect version
     version_str = data.get("openapi", "3.0.0")
-    version = spec_version.Version(version_str)
+    version = spec_version.parse_version(version_str)
 
     # Parse info
     info = model_utils.parse_nested_object(data, "info", spec_info.Info.from_dict)
@@ -67,12 +128,12 @@ def parse_spec_from_dict(data: typing.Mapping[str, typing.Any]) -> spec_openapi.
     # Parse externalDocs
     external_docs = model_utils.parse_nested_object(data, "externalDocs", spec_tag.ExternalDocumentation.from_dict)
 
-    # Convert Mapping to dict for storage
-    # This ensures we have a real dict (not just a Mapping) for the raw field
-    # If data is already a dict, this is a no-op
-    raw_dict = dict(data)
+    # Keep the parsed document itself as the raw field rather than copying it;
+    # only other Mapping types are converted to a real dict
+    raw_dict = data if isinstance(data, dict) else dict(data)
 
-    return spec_openapi.OpenAPISpec(
+    return model_utils.construct_model(
+        spec_openapi.OpenAPISpec,
         raw=raw_dict,
         version=version,
         info=info,
@@ -87,11 +148,13 @@ def parse_spec_from_dict(data: typing.Mapping[str, typing.Any]) -> spec_openapi.
     )
 
 
-def parse_spec_from_json(text: str) -> spec_openapi.OpenAPISpec:
+def parse_spec_from_json(text: str | bytes) -> spec_openapi.OpenAPISpec:
     """Create an OpenAPISpec from a JSON string.
 
+    Uses orjson when it is installed, falling back to the standard library json module.
+
     Args:
-        text: JSON string containing the OpenAPI specification
+        text: JSON string (or UTF-8 encoded bytes) containing the OpenAPI specification
 
     Returns:
         OpenAPISpec instance
@@ -100,15 +163,15 @@ def parse_spec_from_json(text: str) -> spec_openapi.OpenAPISpec:
         >>> json_str = '{"openapi": "3.0.0", "paths": {}, "info": {"title": "API"}}'
         >>> spec = parse_spec_from_json(json_str)
     """
-    data = json.loads(text)
+    data = _JSON_LOADS(text)
     return parse_spec_from_dict(data)
 
 
-def parse_spec_from_yaml(text: str) -> spec_openapi.OpenAPISpec:
+def parse_spec_from_yaml(text: str | bytes) -> spec_openapi.OpenAPISpec:
     """Create an OpenAPISpec from a YAML string.
 
     Args:
-        text: YAML string containing the OpenAPI specification
+        text: YAML string (or encoded bytes) containing the OpenAPI specification
 
     Returns:
         OpenAPISpec instance
@@ -122,11 +185,11 @@ def parse_spec_from_yaml(text: str) -> spec_openapi.OpenAPISpec:
         ... '''
         >>> spec = parse_spec_from_yaml(yaml_str)
     """
-    data = yaml.safe_load(text)
+    data = yaml.load(text, Loader=_YAML_LOADER)
     return parse_spec_from_dict(data)
 
 
-def _parse_with_format_detection(content: str, prefer_yaml: bool = False) -> spec_openapi.OpenAPISpec:
+def _parse_with_format_detection(content: str | bytes, prefer_yaml: bool = False) -> spec_openapi.OpenAPISpec:
     """Parse content with automatic format detection.
 
     Args:
@@ -144,13 +207,18 @@ def _parse_with_format_detection(content: str, prefer_yaml: bool = False) -> spe
         return parse_spec_from_yaml(content)
 
 
-def parse_spec_from_file(path: str | pathlib.Path) -> spec_openapi.OpenAPISpec:
+def parse_spec_from_file(path: str | pathlib.Path, cache: bool = False) -> spec_openapi.OpenAPISpec:
     """Create an OpenAPISpec from a file.
 
     Auto-detects format from file extension (.yaml/.yml for YAML, otherwise tries JSON).
 
+    With cache=True, calling this again for a file whose modification time and size are
+    unchanged returns the same OpenAPISpec instance. That instance is shared by every caller,
+    so changes made to it by one caller are seen by the others. Use clear_cache() to reset.
+
     Args:
         path: Path to the OpenAPI specification file
+        cache: Reuse a previously parsed spec for the same unchanged file
 
     Returns:
         OpenAPISpec instance
@@ -159,18 +227,39 @@ def parse_spec_from_file(path: str | pathlib.Path) -> spec_openapi.OpenAPISpec:
         >>> spec = parse_spec_from_file("openapi.yaml")
     """
     path_obj = pathlib.Path(path) if isinstance(path, str) else path
-    content = path_obj.read_text()
-    prefer_yaml = path_obj.suffix.lower() in [".yaml", ".yml"]
-    return _parse_with_format_detection(content, prefer_yaml)
-
-
-def parse_spec_from_url(url: str) -> spec_openapi.OpenAPISpec:
+    if cache:
+        stat = path_obj.stat()
+        cache_key = str(path_obj.resolve())
+        file_signature = (stat.st_mtime_ns, stat.st_size)
+        if (cached := _cache_get(_FILE_CACHE, cache_key)) is not None and cached[0] == file_signature:
+            return cached[1]
+
+    if path_obj.suffix.lower() in [".yaml", ".yml"]:
+        # Let the YAML loader stream from the file instead of holding the whole text in memory
+        with path_obj.open("rb") as stream:
+            spec = parse_spec_from_dict(yaml.load(stream, Loader=_YAML_LOADER))
+    else:
+        # Read raw bytes: both JSON parsers and PyYAML detect the encoding themselves
+        spec = _parse_with_format_detection(path_obj.read_bytes())
+    if cache:
+        _cache_put(_FILE_CACHE, cache_key, (file_signature, spec))
+    return spec
+
+
+def parse_spec_from_url(url: str, cache: bool = False) -> spec_openapi.OpenAPISpec:
     """Create an OpenAPISpec from a URL.
 
     Detects format from Content-Type header, defaulting to JSON with YAML fallback.
+    Responses are requested gzip-compressed and decompressed transparently.
+
+    With cache=True, if the server sent an ETag or Last-Modified header, the parsed spec is
+    cached and later calls make a conditional request, returning the cached OpenAPISpec on
+    304 Not Modified. That instance is shared by every caller, so changes made to it by one
+    caller are seen by the others. Use clear_cache() to reset.
 
     Args:
         url: URL to fetch the OpenAPI specification from
+        cache: Revalidate and reuse a previously parsed spec for the same URL
 
     Returns:
         OpenAPISpec instance
@@ -178,9 +267,38 @@ def parse_spec_from_url(url: str) -> spec_openapi.OpenAPISpec:
     Example:
         >>> spec = parse_spec_from_url("https://api.example.com/openapi.json")
     """
-    request = urllib_request.Request(url)
-    with urllib_request.urlopen(request) as response:
-        content = response.read().decode("utf-8")
-        content_type = response.headers.get("Content-Type", "")
-        prefer_yaml = "yaml" in content_type or "yml" in content_type
-        return _parse_with_format_detection(content, prefer_yaml)
+    cached = _cache_get(_URL_CACHE, url) if cache else None
+    # Specs are repetitive text and compress well, so ask for gzip
+    headers = {"Accept-Encoding": "gzip"}
+    if cached is not None:
+        headers.update(cached[0])
+    request = urllib_request.Request(url, headers=headers)
+    try:
+        with urllib_request.urlopen(request) as response:
+            content = response.read()
+            if response.headers.get("Content-Encoding", "").lower() == "gzip":
+                content = gzip.decompress(content)
+            content_type = response.headers.get("Content-Type", "")
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+    except urllib_error.HTTPError as e:
+        if e.code == 304 and cached is not None:
+            return cached[1]
+        raise
+
+    prefer_yaml = "yaml" in content_type or "yml" in content_type
+    spec = _parse_with_format_detection(content, prefer_yaml)
+    if not cache:
+        return spec
+
+    # Remember how to revalidate this response on the next request
+    validators = {}
+    if etag:
+        validators["If-None-Match"] = etag
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+    if validators:
+        _cache_put(_URL_CACHE, url, (validators, spec))
+    else:
+        _cache_discard(_URL_CACHE, url)
+    return spec
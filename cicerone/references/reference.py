@@ -7,13 +7,29 @@ References:
 
 from __future__ import annotations
 
+import functools
 import typing
+import urllib.parse
 
 import pydantic
 
 from cicerone.spec import model_utils
 
 
+def _unescape_segment(segment: str) -> str:
+    """Decode a single JSON Pointer segment taken from a URI fragment.
+
+    Fragments are percent-decoded first, then "~1" and "~0" are unescaped (RFC 6901).
+    "~1" must be replaced before "~0", otherwise "~01" would wrongly become "/".
+    Plain segments, which are the common case, are returned untouched.
+    """
+    if "%" in segment:
+        segment = urllib.parse.unquote(segment)
+    if "~" in segment:
+        segment = segment.replace("~1", "/").replace("~0", "~")
+    return segment
+
+
 class Reference(pydantic.BaseModel):
     """Represents an OpenAPI Reference Object containing a $ref keyword.
 
@@ -30,7 +46,8 @@ class Reference(pydantic.BaseModel):
     that override those in the referenced object.
     """
 
-    model_config = {"extra": "allow"}
+    # Frozen so the pointer components derived from ref can be cached safely
+    model_config = {"extra": "allow", "defer_build": True, "frozen": True}
 
     ref: str
     summary: str | None = None
@@ -64,17 +81,17 @@ class Reference(pydantic.BaseModel):
             parts.append(f"description='{model_utils.truncate_text(self.description)}'")
         return f"<Reference: {', '.join(parts)}>"
 
-    @property
+    @functools.cached_property
     def is_local(self) -> bool:
         """Check if this is a local reference (starts with #)."""
         return self.ref.startswith("#")
 
-    @property
+    @functools.cached_property
     def is_external(self) -> bool:
         """Check if this is an external reference (file or URL)."""
         return not self.is_local
 
-    @property
+    @functools.cached_property
     def pointer(self) -> str:
         """Get the JSON Pointer part of the reference.
 
@@ -84,7 +101,7 @@ class Reference(pydantic.BaseModel):
         """
         return self.ref.split("#", 1)[1] if "#" in self.ref else ""
 
-    @property
+    @functools.cached_property
     def document(self) -> str:
         """Get the document part of an external reference.
 
@@ -95,16 +112,18 @@ class Reference(pydantic.BaseModel):
             return self.ref.split("#", 1)[0] if "#" in self.ref else self.ref
         return ""
 
-    @property
+    @functools.cached_property
     def pointer_parts(self) -> list[str]:
         """Get the JSON Pointer as a list of path components.
 
         For example, '#/components/schemas/User' returns ['components', 'schemas', 'User'].
+        Segments are percent-decoded and unescaped per RFC 6901, so '#/paths/~1users' returns ['paths', '/users'].
+        The list is computed once and shared between calls, so it should not be modified.
         """
         pointer = self.pointer
         if not pointer or pointer == "/":
             return []
-        return [p for p in pointer.lstrip("/").split("/") if p]
+        return [_unescape_segment(p) for p in pointer.lstrip("/").split("/") if p]
 
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> Reference:
@@ -121,7 +140,9 @@ class Reference(pydantic.BaseModel):
         """
         if "$ref" not in data:
             raise ValueError("Reference dictionary must contain a '$ref' key")
-        return cls(**data)
+        fields = dict(data)
+        fields["ref"] = fields.pop("$ref")
+        return model_utils.construct_model(cls, **fields)
 
     @classmethod
     def is_reference(cls, data: typing.Any) -> bool:
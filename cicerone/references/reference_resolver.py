@@ -49,14 +49,36 @@ class ReferenceResolver:
     External file and URL references are not yet implemented.
     """
 
-    def __init__(self, spec: spec_openapi.OpenAPISpec) -> None:
+    __slots__ = ("spec", "_resolution_stack", "_resolution_set", "_resolve_cache", "_pointer_index")
+
+    def __init__(
+        self,
+        spec: spec_openapi.OpenAPISpec,
+        cache: dict[tuple[str, bool], typing.Any] | None = None,
+        pointer_index: dict[str, typing.Any] | None = None,
+    ) -> None:
         """Initialize the reference resolver.
 
         Args:
             spec: The OpenAPI specification to resolve references in
+            cache: Optional dict of previously resolved references to share between resolvers
+                for the same spec. A new, empty cache is used if not given.
+            pointer_index: Optional dict of previously navigated JSON pointers to share between
+                resolvers for the same spec. A new, empty index is used if not given.
         """
         self.spec = spec
         self._resolution_stack: list[str] = []
+        # Same refs as _resolution_stack, for constant-time cycle checks; the list keeps the order for errors
+        self._resolution_set: set[str] = set()
+        # (ref string, follow_nested) -> resolved target, for top-level resolve_reference calls
+        self._resolve_cache: dict[tuple[str, bool], typing.Any] = {} if cache is None else cache
+        # Local ref string -> raw node in spec.raw, filled in as pointers are navigated
+        self._pointer_index: dict[str, typing.Any] = {} if pointer_index is None else pointer_index
+
+    def invalidate_cache(self) -> None:
+        """Forget all cached resolutions and pointer lookups, e.g. after modifying spec.raw."""
+        self._resolve_cache.clear()
+        self._pointer_index.clear()
 
     def resolve_reference(
         self,
@@ -72,6 +94,7 @@ class ReferenceResolver:
         Returns:
             The target object as a typed Pydantic model (Schema, Response, etc.) when
             the reference points to a recognized component type. Otherwise returns raw data.
+            Results are cached, so resolving the same reference again returns the same object.
 
         Raises:
             ValueError: If the reference cannot be resolved
@@ -82,39 +105,65 @@ class ReferenceResolver:
             >>> user_schema = resolver.resolve_reference('#/components/schemas/User')
             >>> print(type(user_schema))  # <class 'cicerone.spec.schema.Schema'>
         """
+        ref_str = ref if isinstance(ref, str) else ref.ref
+        # Only top-level calls use the cache: results of nested calls depend on which
+        # references are still being resolved further up the stack
+        if not self._resolution_stack:
+            cache_key = (ref_str, follow_nested)
+            if cache_key in self._resolve_cache:
+                return self._resolve_cache[cache_key]
+            target = self._resolve_uncached(ref, follow_nested)
+            self._resolve_cache[cache_key] = target
+            return target
+        return self._resolve_uncached(ref, follow_nested)
+
+    def _resolve_uncached(self, ref: spec_reference.Reference | str, follow_nested: bool) -> typing.Any:
+        """Resolve a reference without consulting the cache.
+
+        Args:
+            ref: Reference object or reference string
+            follow_nested: If True, recursively resolves nested references
+
+        Returns:
+            The resolved target object
+        """
         # Convert string to Reference object if needed
         if isinstance(ref, str):
             ref = spec_reference.Reference(ref=ref)
 
         # Check for circular references
-        if ref.ref in self._resolution_stack:
+        if ref.ref in self._resolution_set:
             raise RecursionError(f"Circular reference detected: {' -> '.join(self._resolution_stack + [ref.ref])}")
 
+        # Currently only support local references
+        if ref.is_external:
+            raise ValueError(f"External references are not yet supported: {ref.ref}")
+
+        # Looking up the target never recurses, so the stack is only needed when following it further
+        target = self._resolve_local_reference(ref)
+        if not follow_nested:
+            return target
+
+        is_nested_ref = spec_reference.Reference.is_reference(target)
+        if not is_nested_ref and not isinstance(target, pydantic.BaseModel):
+            return target
+
         # Add to resolution stack for circular reference detection
         self._resolution_stack.append(ref.ref)
+        self._resolution_set.add(ref.ref)
 
         try:
-            # Currently only support local references
-            if ref.is_external:
-                raise ValueError(f"External references are not yet supported: {ref.ref}")
-
-            # Resolve local reference
-            target = self._resolve_local_reference(ref)
-
-            # If the target is itself a reference and we should follow it
-            if follow_nested and spec_reference.Reference.is_reference(target):
+            # If the target is itself a reference, follow it
+            if is_nested_ref:
                 nested_ref = spec_reference.Reference.from_dict(target)
                 return self.resolve_reference(nested_ref, follow_nested=True)
 
-            # If follow_nested is True and target is a typed object, resolve nested $refs
-            if follow_nested and not isinstance(target, dict):
-                target = self._resolve_nested_references(target)
-
-            return target
+            # Otherwise the target is a typed object: resolve the $refs nested inside it
+            return self._resolve_nested_references(target)
 
         finally:
             # Remove from resolution stack
-            self._resolution_stack.pop()
+            self._resolution_set.discard(self._resolution_stack.pop())
 
     def _resolve_local_reference(self, ref: spec_reference.Reference) -> typing.Any:
         """Resolve a local reference (starting with #).
@@ -135,21 +184,56 @@ class ReferenceResolver:
             # Reference to the root document
             return self.spec.raw
 
-        # Navigate through the spec using the pointer path
+        # Convert the raw dict to a typed object based on the reference path
+        return self._convert_to_typed_object(ref, self._lookup_raw(ref))
+
+    def _lookup_raw(self, ref: spec_reference.Reference) -> typing.Any:
+        """Return the raw node in spec.raw that a local reference points to.
+
+        Each pointer is only navigated once; later lookups of the same ref hit the pointer index.
+
+        Args:
+            ref: Reference object with a local reference string
+
+        Returns:
+            The raw target data (the whole document for a root reference)
+
+        Raises:
+            ValueError: If the reference path is invalid or not found
+        """
+        parts = ref.pointer_parts
+        if not parts:
+            return self.spec.raw
+        if ref.ref not in self._pointer_index:
+            self._pointer_index[ref.ref] = self._navigate_pointer(ref, parts)
+        return self._pointer_index[ref.ref]
+
+    def _navigate_pointer(self, ref: spec_reference.Reference, parts: list[str]) -> typing.Any:
+        """Follow a JSON pointer's parts through spec.raw.
+
+        Args:
+            ref: Reference being resolved, used for error messages
+            parts: The reference's pointer parts
+
+        Returns:
+            The raw node the pointer refers to
+
+        Raises:
+            ValueError: If the pointer path is not found or passes through a non-container
+        """
         current = self.spec.raw
-        for i, part in enumerate(ref.pointer_parts):
-            path_so_far = "/" + "/".join(ref.pointer_parts[: i + 1])
+        for i, part in enumerate(parts):
             try:
                 current = current[int(part)] if isinstance(current, list) else current[part]
             except (KeyError, IndexError, ValueError) as e:
+                path_so_far = "/" + "/".join(parts[: i + 1])
                 raise ValueError(f"Reference path not found: {ref.ref} (failed at {path_so_far})") from e
             except TypeError as e:
+                path_so_far = "/" + "/".join(parts[: i + 1])
                 raise ValueError(
                     f"Cannot navigate through non-dict/list object: {ref.ref} (failed at {path_so_far})"
                 ) from e
-
-        # Convert the raw dict to a typed object based on the reference path
-        return self._convert_to_typed_object(ref, current)
+        return current
 
     def _convert_to_typed_object(self, ref: spec_reference.Reference, data: typing.Any) -> typing.Any:
         """Convert raw data to a typed Pydantic object based on the reference path.
@@ -174,9 +258,9 @@ class ReferenceResolver:
             if constructor := COMPONENT_TYPE_MAP.get(parts[1]):
                 return constructor(data)
 
-        # Map paths to PathItem objects
-        if parts[0] == "paths" and len(parts) >= 2:
-            path = "/" + "/".join(parts[1:])  # Reconstruct the path
+        # Map paths to PathItem objects; deeper pointers (into an operation, say) stay raw data
+        if parts[0] == "paths" and len(parts) == 2:
+            path = parts[1] if parts[1].startswith("/") else "/" + parts[1]
             return spec_path_item.PathItem.from_dict(path, data)
 
         # If we can't determine the type, return raw data
@@ -218,7 +302,9 @@ class ReferenceResolver:
         Returns:
             The $ref string if found, None otherwise
         """
-        return getattr(model, "__pydantic_extra__", {}).get("$ref")
+        # __pydantic_extra__ is None for models that don't allow extras, and usually an empty dict otherwise
+        extra = model.__pydantic_extra__
+        return extra.get("$ref") if extra else None
 
     def _try_resolve_ref(self, ref: str) -> typing.Any | None:
         """Attempt to resolve a reference, returning None on failure.
@@ -279,7 +365,8 @@ class ReferenceResolver:
     ) -> dict[str, spec_reference.Reference]:
         """Find all references in an object or the entire spec.
 
-        Recursively searches for all $ref keywords in the given object or the entire spec.
+        Searches depth-first for all $ref keywords in the given object or the entire spec,
+        using an explicit stack so deeply nested documents don't hit the recursion limit.
 
         Args:
             obj: Object to search for references (defaults to entire spec)
@@ -296,29 +383,32 @@ class ReferenceResolver:
             >>> # Get all local references
             >>> local_refs = {k: v for k, v in all_refs.items() if v.is_local}
         """
-        obj = obj or self.spec.raw
-        visited = visited or set()
-
-        # Avoid infinite recursion on circular structures
-        if (obj_id := id(obj)) in visited:
-            return {}
-        visited.add(obj_id)
-
-        references = {}
-
-        # Check if this object is a reference
-        if spec_reference.Reference.is_reference(obj):
-            ref = spec_reference.Reference.from_dict(obj)
-            references[ref.ref] = ref
-
-        # Recursively search through collections
-        match obj:
-            case dict():
-                for value in obj.values():
-                    references.update(self.get_all_references(value, visited))
-            case list():
-                for item in obj:
-                    references.update(self.get_all_references(item, visited))
+        visited = set() if visited is None else visited
+        references: dict[str, spec_reference.Reference] = {}
+        stack = [obj or self.spec.raw]
+
+        while stack:
+            current = stack.pop()
+
+            # Avoid infinite loops on circular structures
+            if (obj_id := id(current)) in visited:
+                continue
+            visited.add(obj_id)
+
+            match current:
+                case dict():
+                    # Same check as Reference.is_reference, inlined since we already know it's a dict
+                    if "$ref" in current:
+                        ref = spec_reference.Reference.from_dict(current)
+                        references[ref.ref] = ref
+                    children = current.values()
+                case list():
+                    children = current
+                case _:
+                    continue
+
+            # Only containers can hold references. Push them in reverse so they are visited in document order
+            stack.extend(child for child in reversed(children) if isinstance(child, (dict, list)))
 
         return references
 
@@ -336,12 +426,19 @@ class ReferenceResolver:
             >>> if resolver.is_circular_reference('#/components/schemas/Node'):
             ...     print("This schema has a circular reference")
         """
-        # Convert string to Reference if needed
-        if isinstance(ref, str):
-            ref = spec_reference.Reference(ref=ref)
-
-        try:
-            self.resolve_reference(ref, follow_nested=True)
-            return False
-        except RecursionError:
-            return True
+        ref_str = ref if isinstance(ref, str) else ref.ref
+
+        # Only a chain of $ref objects pointing directly at each other is circular; a $ref nested
+        # inside a target (e.g. a recursive tree schema) is left unresolved by resolve_reference
+        # instead. So follow the chain through the raw document without building any models.
+        seen: set[str] = set()
+        while ref_str not in seen:
+            seen.add(ref_str)
+            current = spec_reference.Reference(ref=ref_str)
+            if current.is_external:
+                raise ValueError(f"External references are not yet supported: {ref_str}")
+            target = self._lookup_raw(current)
+            if not spec_reference.Reference.is_reference(target):
+                return False
+            ref_str = target["$ref"]
+        return True
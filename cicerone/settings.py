@@ -1,3 +1,4 @@
+import os
 import platform
 
 VERSION = "0.3.0"
@@ -8,3 +9,7 @@ def split_ver():
 
 
 PY_VERSION = split_ver()
+
+# Set CICERONE_VALIDATE=1 to run full pydantic validation when building models
+# from spec data, instead of trusting the parsed input and skipping it.
+VALIDATE_MODELS = os.environ.get("CICERONE_VALIDATE") == "1"
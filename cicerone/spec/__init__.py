@@ -23,16 +23,13 @@ from cicerone.spec.tag import ExternalDocumentation, Tag
 from cicerone.spec.version import Version
 from cicerone.spec.webhooks import Webhooks
 
-Header.model_rebuild()
-Parameter.model_rebuild()
-Response.model_rebuild()
-Components.model_rebuild()
+# Models set defer_build, so their validators (and forward references such as Header -> Schema)
+# are built on first validation rather than at import. Parsing uses model_construct and never needs them.
 
 __all__ = [
     "Callback",
     "Components",
     "Contact",
-    "Contact",
     "Encoding",
     "Example",
     "ExternalDocumentation",
@@ -10,6 +10,7 @@ import typing
 
 import pydantic
 
+from cicerone.spec import model_utils
 from cicerone.spec import path_item as spec_path_item
 
 
@@ -21,7 +22,7 @@ class Callback(pydantic.BaseModel):
     """
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     # Callbacks are a dict of expression -> PathItem
     expressions: dict[str, spec_path_item.PathItem] = pydantic.Field(default_factory=dict)
@@ -41,7 +42,7 @@ class Callback(pydantic.BaseModel):
         for expression, path_item_data in data.items():
             expressions[expression] = spec_path_item.PathItem.from_dict(expression, path_item_data)
 
-        return cls(expressions=expressions)
+        return model_utils.construct_model(cls, expressions=expressions)
 
     def get(self, expression: str) -> spec_path_item.PathItem | None:
         """Get a PathItem for a given expression.
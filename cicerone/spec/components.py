@@ -29,8 +29,9 @@ class Components(pydantic.BaseModel):
     # - Vendor extensions (x-* fields) per OpenAPI spec
     # - Future spec additions without breaking compatibility
     # - Preservation of all data for raw access
+    # defer_build: Build the validator on first validation instead of at import
     # populate_by_name: Allow using either field name or alias
-    model_config = {"extra": "allow", "populate_by_name": True}
+    model_config = {"extra": "allow", "defer_build": True, "populate_by_name": True}
 
     schemas: dict[str, spec_schema.Schema] = pydantic.Field(default_factory=dict)
     responses: dict[str, spec_response.Response] = pydantic.Field(default_factory=dict)
@@ -89,7 +90,8 @@ class Components(pydantic.BaseModel):
         # OpenAPI 3.x: components object
         if "components" in raw:
             components = raw["components"]
-            return cls(
+            return model_utils.construct_model(
+                cls,
                 schemas=model_utils.parse_collection(components, "schemas", spec_schema.Schema.from_dict),
                 responses=model_utils.parse_collection(components, "responses", spec_response.Response.from_dict),
                 parameters=model_utils.parse_collection(components, "parameters", spec_parameter.Parameter.from_dict),
@@ -105,4 +107,4 @@ class Components(pydantic.BaseModel):
                 callbacks=model_utils.parse_collection(components, "callbacks", spec_callback.Callback.from_dict),
             )
 
-        return cls()
+        return model_utils.construct_model(cls)
@@ -10,6 +10,8 @@ import typing
 
 import pydantic
 
+from cicerone.spec import model_utils
+
 
 class Encoding(pydantic.BaseModel):
     """Represents an OpenAPI Encoding Object.
@@ -18,7 +20,7 @@ class Encoding(pydantic.BaseModel):
     """
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     contentType: str | None = None
     headers: dict[str, typing.Any] = pydantic.Field(default_factory=dict)  # Header objects
@@ -30,4 +32,4 @@ class Encoding(pydantic.BaseModel):
     def from_dict(cls, data: dict[str, typing.Any]) -> Encoding:
         """Create an Encoding from a dictionary."""
         # Simple passthrough - pydantic handles all fields with extra="allow"
-        return cls(**data)
+        return model_utils.construct_model(cls, **data)
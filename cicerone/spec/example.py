@@ -8,12 +8,14 @@ import typing
 
 import pydantic
 
+from cicerone.spec import model_utils
+
 
 class Example(pydantic.BaseModel):
     """Represents an OpenAPI example object."""
 
     # Allow extra fields to support vendor extensions and future spec additions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     summary: str | None = None
     description: str | None = None
@@ -24,4 +26,4 @@ class Example(pydantic.BaseModel):
     def from_dict(cls, data: dict[str, typing.Any]) -> "Example":
         """Create an Example from a dictionary."""
         # Simple passthrough - pydantic handles all fields with extra="allow"
-        return cls(**data)
+        return model_utils.construct_model(cls, **data)
@@ -19,7 +19,7 @@ class Header(pydantic.BaseModel):
     """Represents an OpenAPI header object."""
 
     # Allow extra fields to support vendor extensions and future spec additions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     description: str | None = None
     required: bool = False
@@ -32,14 +32,7 @@ class Header(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> Header:
         """Create a Header from a dictionary."""
-        excluded = {"description", "required", "schema", "style", "explode", "example", "examples"}
-        return cls(
-            description=data.get("description"),
-            required=data.get("required", False),
-            schema=model_utils.parse_nested_object(data, "schema", spec_schema.Schema.from_dict),
-            style=data.get("style"),
-            explode=data.get("explode"),
-            example=data.get("example"),
-            examples=model_utils.parse_collection(data, "examples", spec_example.Example.from_dict),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        fields = model_utils.parse_collections(data, {"examples": spec_example.Example.from_dict})
+        if "schema" in data:
+            fields["schema"] = spec_schema.Schema.from_dict(data["schema"])
+        return model_utils.construct_model(cls, **fields)
@@ -19,7 +19,7 @@ class Contact(pydantic.BaseModel):
     """Represents contact information for the API."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     name: str | None = None
     url: str | None = None
@@ -28,20 +28,14 @@ class Contact(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> Contact:
         """Create a Contact from a dictionary."""
-        excluded = {"name", "url", "email"}
-        return cls(
-            name=data.get("name"),
-            url=data.get("url"),
-            email=data.get("email"),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        return model_utils.construct_model(cls, **data)
 
 
 class License(pydantic.BaseModel):
     """Represents license information for the API."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     name: str
     url: str | None = None
@@ -50,20 +44,15 @@ class License(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> License:
         """Create a License from a dictionary."""
-        excluded = {"name", "url", "identifier"}
-        return cls(
-            name=data["name"],
-            url=data.get("url"),
-            identifier=data.get("identifier"),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        model_utils.require_fields(data, "name")
+        return model_utils.construct_model(cls, **data)
 
 
 class Info(pydantic.BaseModel):
     """Represents the Info object of an OpenAPI specification."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     title: str
     version: str
@@ -83,14 +72,10 @@ class Info(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> Info:
         """Create an Info object from a dictionary."""
-        excluded = {"title", "version", "summary", "description", "termsOfService", "contact", "license"}
-        return cls(
-            title=data["title"],
-            version=data["version"],
-            summary=data.get("summary"),
-            description=data.get("description"),
-            termsOfService=data.get("termsOfService"),
-            contact=model_utils.parse_nested_object(data, "contact", Contact.from_dict),
-            license=model_utils.parse_nested_object(data, "license", License.from_dict),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        model_utils.require_fields(data, "title", "version")
+        fields = dict(data)
+        if "contact" in data:
+            fields["contact"] = Contact.from_dict(data["contact"])
+        if "license" in data:
+            fields["license"] = License.from_dict(data["license"])
+        return model_utils.construct_model(cls, **fields)
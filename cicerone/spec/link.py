@@ -8,12 +8,14 @@ import typing
 
 import pydantic
 
+from cicerone.spec import model_utils
+
 
 class Link(pydantic.BaseModel):
     """Represents an OpenAPI Link Object."""
 
     # Allow extra fields to support vendor extensions and future spec additions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     operationRef: str | None = None
     operationId: str | None = None
@@ -26,4 +28,4 @@ class Link(pydantic.BaseModel):
     def from_dict(cls, data: dict[str, typing.Any]) -> "Link":
         """Create a Link from a dictionary."""
         # Simple passthrough - pydantic handles all fields with extra="allow"
-        return cls(**data)
+        return model_utils.construct_model(cls, **data)
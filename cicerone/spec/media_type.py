@@ -19,7 +19,7 @@ class MediaType(pydantic.BaseModel):
     """Represents an OpenAPI Media Type Object."""
 
     # Allow extra fields to support vendor extensions and future spec additions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     schema_: dict[str, typing.Any] | None = pydantic.Field(None, alias="schema")
     example: typing.Any | None = None
@@ -29,10 +29,8 @@ class MediaType(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> MediaType:
         """Create a MediaType from a dictionary."""
-        return cls(
-            schema=data.get("schema"),
-            example=data.get("example"),
-            examples=model_utils.parse_collection(data, "examples", spec_example.Example.from_dict),
-            encoding=model_utils.parse_collection(data, "encoding", spec_encoding.Encoding.from_dict),
-            **{k: v for k, v in data.items() if k not in {"schema", "example", "examples", "encoding"}},
+        fields = model_utils.parse_collections(
+            data,
+            {"examples": spec_example.Example.from_dict, "encoding": spec_encoding.Encoding.from_dict},
         )
+        return model_utils.construct_model(cls, **fields)
@@ -8,7 +8,55 @@ from __future__ import annotations
 
 import typing
 
+import pydantic
+
+from cicerone import settings
+
 T = typing.TypeVar("T")
+M = typing.TypeVar("M", bound=pydantic.BaseModel)
+
+
+def construct_model(model_cls: type[M], **fields: typing.Any) -> M:
+    """Build a model from already-parsed spec data without re-validating it.
+
+    The from_dict() constructors build nested models themselves, so running pydantic
+    validation over the result only repeats that work. Fields may be passed by alias.
+    Set CICERONE_VALIDATE=1 to validate anyway, e.g. for correctness runs in CI.
+
+    Args:
+        model_cls: The pydantic model class to build
+        **fields: Field values (by name or alias), plus any extra fields
+
+    Returns:
+        Instance of model_cls
+
+    Example:
+        construct_model(Schema, type="string", format="uuid")
+    """
+    if settings.VALIDATE_MODELS:
+        return model_cls(**fields)
+    return model_cls.model_construct(**fields)
+
+
+def require_fields(data: typing.Mapping[str, typing.Any], *keys: str) -> None:
+    """Check that data contains every required key.
+
+    construct_model() does not validate, so from_dict() constructors call this to keep
+    rejecting objects that are missing required fields.
+
+    Args:
+        data: Dictionary the model is built from
+        *keys: Required keys, as spelled in the spec
+
+    Raises:
+        KeyError: For the first required key that is missing
+
+    Example:
+        require_fields(data, "name")
+    """
+    for key in keys:
+        if key not in data:
+            raise KeyError(key)
 
 
 def truncate_text(text: str, max_len: int = 50) -> str:
@@ -73,6 +121,32 @@ def parse_collection(
     return {}
 
 
+def parse_collections(
+    data: typing.Mapping[str, typing.Any],
+    parsers: typing.Mapping[str, typing.Callable[[dict[str, typing.Any]], typing.Any]],
+) -> dict[str, typing.Any]:
+    """Copy data, parsing each named collection that is present with its parser.
+
+    Keys without a parser are copied as-is, so the result can be passed straight to
+    construct_model() with known fields and extras together.
+
+    Args:
+        data: Source dictionary
+        parsers: Mapping of collection field names to the function that parses each item
+
+    Returns:
+        Shallow copy of data with the named collections replaced by parsed objects
+
+    Example:
+        parse_collections(data, {"examples": Example.from_dict, "encoding": Encoding.from_dict})
+    """
+    fields = dict(data)
+    for field_name, parser_func in parsers.items():
+        if field_name in data:
+            fields[field_name] = {name: parser_func(item_data) for name, item_data in data[field_name].items()}
+    return fields
+
+
 def parse_list(
     data: typing.Mapping[str, typing.Any],
     field_name: str,
@@ -11,12 +11,15 @@ import pydantic
 
 from cicerone.spec import model_utils
 
+# Flow types an OAuth Flows Object can hold
+OAUTH_FLOW_TYPES = ("implicit", "password", "clientCredentials", "authorizationCode")
+
 
 class OAuthFlow(pydantic.BaseModel):
     """Represents an OpenAPI OAuth Flow Object."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     authorizationUrl: str | None = None
     tokenUrl: str | None = None
@@ -26,15 +29,15 @@ class OAuthFlow(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> "OAuthFlow":
         """Create an OAuthFlow from a dictionary."""
-        # Simple passthrough - pydantic handles all fields with extra="allow"
-        return cls(**data)
+        # Simple passthrough - extra="allow" keeps any vendor extensions
+        return model_utils.construct_model(cls, **data)
 
 
 class OAuthFlows(pydantic.BaseModel):
     """Represents an OpenAPI OAuth Flows Object."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     implicit: OAuthFlow | None = None
     password: OAuthFlow | None = None
@@ -44,11 +47,8 @@ class OAuthFlows(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> "OAuthFlows":
         """Create an OAuthFlows from a dictionary."""
-        excluded = {"implicit", "password", "clientCredentials", "authorizationCode"}
-        return cls(
-            implicit=model_utils.parse_nested_object(data, "implicit", OAuthFlow.from_dict),
-            password=model_utils.parse_nested_object(data, "password", OAuthFlow.from_dict),
-            clientCredentials=model_utils.parse_nested_object(data, "clientCredentials", OAuthFlow.from_dict),
-            authorizationCode=model_utils.parse_nested_object(data, "authorizationCode", OAuthFlow.from_dict),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        fields = dict(data)
+        for flow_type in OAUTH_FLOW_TYPES:
+            if flow_type in data:
+                fields[flow_type] = OAuthFlow.from_dict(data[flow_type])
+        return model_utils.construct_model(cls, **fields)
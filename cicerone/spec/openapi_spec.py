@@ -28,8 +28,9 @@ class OpenAPISpec(pydantic.BaseModel):
 
     # Model configuration:
     # - extra="allow": Supports vendor extensions (x-* fields) and preserves all spec data
+    # - defer_build=True: Build the validator on first validation instead of at import
     # - arbitrary_types_allowed=True: Required for the custom Version class (non-Pydantic)
-    model_config = {"extra": "allow", "arbitrary_types_allowed": True}
+    model_config = {"extra": "allow", "defer_build": True, "arbitrary_types_allowed": True}
 
     raw: dict[str, typing.Any]
     version: spec_version.Version
@@ -43,9 +44,15 @@ class OpenAPISpec(pydantic.BaseModel):
     tags: list[spec_tag.Tag] = pydantic.Field(default_factory=list)
     external_docs: spec_tag.ExternalDocumentation | None = pydantic.Field(None, alias="externalDocs")
 
+    # operationId -> Operation lookup table, built on the first operation_by_operation_id() call
+    _operation_index: dict[str, spec_operation.Operation] | None = pydantic.PrivateAttr(None)
+    # Resolved references, shared by the resolvers created in resolve_reference()
+    _reference_cache: dict[tuple[str, bool], typing.Any] = pydantic.PrivateAttr(default_factory=dict)
+    _pointer_index: dict[str, typing.Any] = pydantic.PrivateAttr(default_factory=dict)
+
     def __str__(self) -> str:
         """Return a readable string representation of the OpenAPI spec."""
-        title = self.raw.get("info", {}).get("title", "Untitled")
+        title = self.info.title if self.info and self.info.title else "Untitled"
         num_paths = len(self.paths.items)
         num_schemas = len(self.components.schemas)
         return f"<OpenAPISpec: '{title}' v{self.version}, {num_paths} paths, {num_schemas} schemas>"
@@ -53,6 +60,10 @@ class OpenAPISpec(pydantic.BaseModel):
     def operation_by_operation_id(self, operation_id: str) -> spec_operation.Operation | None:
         """Find an operation by its operationId.
 
+        An index of all operations is built on the first call, so repeated lookups are constant time.
+        If several operations share an operationId, the first one in the spec is returned.
+        Call invalidate_caches() after adding or removing operations so the index is rebuilt.
+
         Args:
             operation_id: The operationId to search for
 
@@ -64,10 +75,42 @@ class OpenAPISpec(pydantic.BaseModel):
             >>> spec = parse_spec_from_file("openapi.yaml")
             >>> op = spec.operation_by_operation_id("listUsers")
         """
-        for operation in self.paths.all_operations():
-            if operation.operation_id == operation_id:
-                return operation
-        return None
+        return self._get_operation_index().get(operation_id)
+
+    @classmethod
+    def build_operation_id_index(
+        cls, specs: typing.Iterable[OpenAPISpec]
+    ) -> dict[str, tuple[OpenAPISpec, spec_operation.Operation]]:
+        """Build a single operationId lookup table across several specs.
+
+        Useful when many specs are loaded at once, e.g. for code generation over a monorepo.
+        If several operations share an operationId, the first one found (in spec order) wins.
+
+        Args:
+            specs: The specs to index
+
+        Returns:
+            Dictionary mapping each operationId to its spec and Operation
+
+        Example:
+            >>> index = OpenAPISpec.build_operation_id_index([users_spec, billing_spec])
+            >>> spec, op = index["listUsers"]
+        """
+        index: dict[str, tuple[OpenAPISpec, spec_operation.Operation]] = {}
+        for spec in specs:
+            for operation_id, operation in spec._get_operation_index().items():
+                index.setdefault(operation_id, (spec, operation))
+        return index
+
+    def _get_operation_index(self) -> dict[str, spec_operation.Operation]:
+        """Return the operationId -> Operation index, building it on first use."""
+        if self._operation_index is None:
+            index: dict[str, spec_operation.Operation] = {}
+            for operation in self.paths.all_operations():
+                if operation.operation_id is not None:
+                    index.setdefault(operation.operation_id, operation)
+            self._operation_index = index
+        return self._operation_index
 
     def all_operations(self) -> typing.Generator[spec_operation.Operation, None, None]:
         """Yield all operations in the spec (from paths and webhooks).
@@ -92,7 +135,8 @@ class OpenAPISpec(pydantic.BaseModel):
 
         This method resolves $ref references in the OpenAPI specification,
         supporting both local references (within this document) and following
-        chains of nested references.
+        chains of nested references. Results are cached on the spec; call
+        invalidate_reference_cache() after modifying raw.
 
         Args:
             ref: Reference object or reference string (e.g., '#/components/schemas/User')
@@ -113,9 +157,25 @@ class OpenAPISpec(pydantic.BaseModel):
             >>> # Returns a Schema object, not a dict
             >>> print(type(user_schema))  # <class 'cicerone.spec.schema.Schema'>
         """
-        resolver = spec_reference_resolver.ReferenceResolver(self)
+        resolver = spec_reference_resolver.ReferenceResolver(
+            self, cache=self._reference_cache, pointer_index=self._pointer_index
+        )
         return resolver.resolve_reference(ref, follow_nested=follow_nested)
 
+    def invalidate_reference_cache(self) -> None:
+        """Forget all references cached by resolve_reference(), e.g. after modifying raw."""
+        self._reference_cache.clear()
+        self._pointer_index.clear()
+
+    def invalidate_caches(self) -> None:
+        """Forget everything cached on the spec, e.g. after modifying paths or raw.
+
+        This drops the operationId index used by operation_by_operation_id() and
+        build_operation_id_index(), as well as the references cached by resolve_reference().
+        """
+        self._operation_index = None
+        self.invalidate_reference_cache()
+
     def get_all_references(self) -> dict[str, spec_reference.Reference]:
         """Get all references in the specification.
 
@@ -6,26 +6,19 @@ References:
 
 from __future__ import annotations
 
+import sys
 import typing
 
 import pydantic
 
+from cicerone.spec import model_utils
+
 
 class Operation(pydantic.BaseModel):
     """Represents an HTTP operation (GET, POST, etc.)."""
 
     # Allow extra fields to support vendor extensions and future spec additions
-    model_config = {"extra": "allow"}
-
-    # Fields that are explicitly mapped in from_dict() to avoid double-processing
-    EXPLICITLY_MAPPED_FIELDS: typing.ClassVar[set[str]] = {
-        "operationId",
-        "summary",
-        "description",
-        "tags",
-        "parameters",
-        "responses",
-    }
+    model_config = {"extra": "allow", "defer_build": True}
 
     method: str
     path: str
@@ -50,14 +43,9 @@ class Operation(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, method: str, path: str, data: typing.Mapping[str, typing.Any]) -> "Operation":
         """Create an Operation from a dictionary."""
-        return cls(
-            method=method,
-            path=path,
-            operationId=data.get("operationId"),
-            summary=data.get("summary"),
-            description=data.get("description"),
-            tags=data.get("tags", []),
-            parameters=data.get("parameters", []),
-            responses=data.get("responses", {}),
-            **{k: v for k, v in data.items() if k not in cls.EXPLICITLY_MAPPED_FIELDS},
-        )
+        if isinstance(tags := data.get("tags"), list):
+            # The same tag names repeat across many operations; intern them so they share one string
+            data = {**data, "tags": [sys.intern(tag) if isinstance(tag, str) else tag for tag in tags]}
+        # Known fields are picked up by name or alias; everything else lands in the extras.
+        # Unpacking already copies data, so there is no need to copy it beforehand.
+        return model_utils.construct_model(cls, method=method, path=path, **data)
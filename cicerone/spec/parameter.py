@@ -6,6 +6,7 @@ References:
 
 from __future__ import annotations
 
+import sys
 import typing
 
 import pydantic
@@ -19,7 +20,7 @@ class Parameter(pydantic.BaseModel):
     """Represents an OpenAPI parameter object."""
 
     # Allow extra fields to support vendor extensions and future spec additions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     name: str | None = None
     in_: str | None = pydantic.Field(None, alias="in")
@@ -35,26 +36,14 @@ class Parameter(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> Parameter:
         """Create a Parameter from a dictionary."""
-        excluded = {
-            "name",
-            "in",
-            "description",
-            "required",
-            "schema",
-            "style",
-            "explode",
-            "example",
-            "examples",
-        }
-        return cls(
-            name=data.get("name"),
-            **{"in": data.get("in")},
-            description=data.get("description"),
-            required=data.get("required", False),
-            schema=model_utils.parse_nested_object(data, "schema", spec_schema.Schema.from_dict),
-            style=data.get("style"),
-            explode=data.get("explode"),
-            example=data.get("example"),
-            examples=model_utils.parse_collection(data, "examples", spec_example.Example.from_dict),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        fields = dict(data)
+        # Locations, styles and common names (e.g. "query", "form", "id") repeat across
+        # many parameters; intern them so they share one string
+        for key in ("name", "in", "style"):
+            if isinstance(value := data.get(key), str):
+                fields[key] = sys.intern(value)
+        if "schema" in data:
+            fields["schema"] = spec_schema.Schema.from_dict(data["schema"])
+        if "examples" in data:
+            fields["examples"] = model_utils.parse_collection(data, "examples", spec_example.Example.from_dict)
+        return model_utils.construct_model(cls, **fields)
@@ -4,18 +4,33 @@ References:
 - OpenAPI 3.x Path Item Object: https://spec.openapis.org/oas/v3.1.0#path-item-object
 """
 
+import collections.abc
+import sys
 import typing
 
 import pydantic
 
+from cicerone.spec import model_utils
 from cicerone.spec import operation as spec_operation
 
+# HTTP methods a Path Item can hold, in canonical order, mapped to their upper-case form
+HTTP_METHODS: dict[str, str] = {
+    "get": "GET",
+    "post": "POST",
+    "put": "PUT",
+    "patch": "PATCH",
+    "delete": "DELETE",
+    "options": "OPTIONS",
+    "head": "HEAD",
+    "trace": "TRACE",
+}
+
 
 class PathItem(pydantic.BaseModel):
     """Represents a path item with its operations."""
 
     # Allow extra fields to support vendor extensions and path-level parameters
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     path: str
     operations: dict[str, spec_operation.Operation] = pydantic.Field(default_factory=dict)
@@ -29,25 +44,28 @@ class PathItem(pydantic.BaseModel):
     def from_dict(cls, path: str, data: typing.Mapping[str, typing.Any]) -> "PathItem":
         """Create a PathItem from a dictionary."""
         operations = {}
-        http_methods = ["get", "post", "put", "patch", "delete", "options", "head", "trace"]
+        # Interned so the PathItem and all of its operations share a single path string
+        path = sys.intern(path)
 
         # Extract path-level parameters if they exist
         # Note: We check isinstance as a defensive measure because some callers
         # (like callbacks with invalid test data) may pass non-Mapping types
-        path_level_parameters = data.get("parameters", []) if isinstance(data, typing.Mapping) else []
+        path_level_parameters = data.get("parameters", []) if isinstance(data, collections.abc.Mapping) else []
 
-        for method in http_methods:
+        for method, method_upper in HTTP_METHODS.items():
             if method in data:
                 # Only create a copy if we need to merge path-level parameters
                 if path_level_parameters:
-                    operation_data = dict(data[method])
+                    method_data = data[method]
                     # Merge path-level parameters with operation-level parameters
                     # Path-level parameters come first, operation-level parameters come after
-                    operation_params = operation_data.get("parameters", [])
-                    operation_data["parameters"] = path_level_parameters + operation_params
-                    operations[method] = spec_operation.Operation.from_dict(method.upper(), path, operation_data)
+                    operation_data = {
+                        **method_data,
+                        "parameters": path_level_parameters + method_data.get("parameters", []),
+                    }
+                    operations[method] = spec_operation.Operation.from_dict(method_upper, path, operation_data)
                 else:
                     # No path-level parameters, use operation data as-is
-                    operations[method] = spec_operation.Operation.from_dict(method.upper(), path, data[method])
+                    operations[method] = spec_operation.Operation.from_dict(method_upper, path, data[method])
 
-        return cls(path=path, operations=operations)
+        return model_utils.construct_model(cls, path=path, operations=operations)
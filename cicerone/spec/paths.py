@@ -6,10 +6,12 @@ References:
 
 from __future__ import annotations
 
+import itertools
 import typing
 
 import pydantic
 
+from cicerone.spec import model_utils
 from cicerone.spec import operation as spec_operation
 from cicerone.spec import path_item as spec_path_item
 
@@ -18,7 +20,7 @@ class Paths(pydantic.BaseModel):
     """Container for all path items in the spec."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     items: dict[str, spec_path_item.PathItem] = pydantic.Field(default_factory=dict)
 
@@ -26,7 +28,7 @@ class Paths(pydantic.BaseModel):
         """Return a readable string representation of the paths container."""
         num_paths = len(self.items)
         num_ops = sum(len(item.operations) for item in self.items.values())
-        paths_preview = ", ".join(list(self.items.keys())[:3])
+        paths_preview = ", ".join(itertools.islice(self.items, 3))
         if num_paths > 3:
             paths_preview += f", ... (+{num_paths - 3} more)"
         return f"<Paths: {num_paths} paths, {num_ops} operations [{paths_preview}]>"
@@ -47,8 +49,9 @@ class Paths(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: typing.Mapping[str, typing.Any]) -> "Paths":
         """Create Paths from a dictionary."""
-        items = {}
-        for path, path_data in data.items():
-            if isinstance(path_data, dict):
-                items[path] = spec_path_item.PathItem.from_dict(path, path_data)
-        return cls(items=items)
+        items = {
+            path: spec_path_item.PathItem.from_dict(path, path_data)
+            for path, path_data in data.items()
+            if isinstance(path_data, dict)
+        }
+        return model_utils.construct_model(cls, items=items)
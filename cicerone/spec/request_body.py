@@ -18,7 +18,7 @@ class RequestBody(pydantic.BaseModel):
     """Represents an OpenAPI request body object."""
 
     # Allow extra fields to support vendor extensions and future spec additions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     description: str | None = None
     content: dict[str, spec_media_type.MediaType] = pydantic.Field(default_factory=dict)
@@ -27,9 +27,5 @@ class RequestBody(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> "RequestBody":
         """Create a RequestBody from a dictionary."""
-        return cls(
-            description=data.get("description"),
-            content=model_utils.parse_collection(data, "content", spec_media_type.MediaType.from_dict),
-            required=data.get("required", False),
-            **{k: v for k, v in data.items() if k not in {"description", "content", "required"}},
-        )
+        fields = model_utils.parse_collections(data, {"content": spec_media_type.MediaType.from_dict})
+        return model_utils.construct_model(cls, **fields)
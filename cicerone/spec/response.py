@@ -21,7 +21,7 @@ class Response(pydantic.BaseModel):
     """Represents an OpenAPI response object."""
 
     # Allow extra fields to support vendor extensions and future spec additions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     description: str | None = None
     content: dict[str, spec_media_type.MediaType] = pydantic.Field(default_factory=dict)
@@ -32,12 +32,13 @@ class Response(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> Response:
         """Create a Response from a dictionary."""
-        excluded = {"description", "content", "headers", "links", "examples"}
-        return cls(
-            description=data.get("description"),
-            content=model_utils.parse_collection(data, "content", spec_media_type.MediaType.from_dict),
-            headers=model_utils.parse_collection(data, "headers", spec_header.Header.from_dict),
-            links=model_utils.parse_collection(data, "links", spec_link.Link.from_dict),
-            examples=model_utils.parse_collection(data, "examples", spec_example.Example.from_dict),
-            **{k: v for k, v in data.items() if k not in excluded},
+        fields = model_utils.parse_collections(
+            data,
+            {
+                "content": spec_media_type.MediaType.from_dict,
+                "headers": spec_header.Header.from_dict,
+                "links": spec_link.Link.from_dict,
+                "examples": spec_example.Example.from_dict,
+            },
         )
+        return model_utils.construct_model(cls, **fields)
@@ -13,12 +13,36 @@ import pydantic
 
 from cicerone.spec import model_utils
 
+# Keywords holding a single nested schema, a list of schemas, or a name -> schema mapping
+SINGLE_SCHEMA_KEYWORDS = ("items", "not")
+SCHEMA_LIST_KEYWORDS = ("allOf", "oneOf", "anyOf")
+SCHEMA_MAP_KEYWORDS = ("properties",)
+NESTED_SCHEMA_KEYWORDS = frozenset(SINGLE_SCHEMA_KEYWORDS + SCHEMA_LIST_KEYWORDS + SCHEMA_MAP_KEYWORDS)
+# Non-schema keywords whose declared field type is a list
+LIST_VALUE_KEYWORDS = ("type", "required")
+
+
+def _nested_schemas(data: dict[str, typing.Any]) -> list[tuple[str, str | None, dict[str, typing.Any]]]:
+    """List the (keyword, property name, schema dict) of each schema nested directly in data."""
+    nested: list[tuple[str, str | None, dict[str, typing.Any]]] = []
+    if "properties" in data:
+        nested.extend(("properties", name, item_data) for name, item_data in data["properties"].items())
+    if "items" in data:
+        nested.append(("items", None, data["items"]))
+    for keyword in SCHEMA_LIST_KEYWORDS:
+        # Composition keywords should only contain schema objects; skip anything else
+        if isinstance(data.get(keyword), list):
+            nested.extend((keyword, None, item_data) for item_data in data[keyword] if isinstance(item_data, dict))
+    if "not" in data:
+        nested.append(("not", None, data["not"]))
+    return nested
+
 
 class Schema(pydantic.BaseModel):
     """Represents a JSON Schema / OpenAPI Schema object."""
 
     # Allow extra fields to support full JSON Schema vocabulary and vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     title: str | None = None
     type: str | list[str] | None = None
@@ -51,31 +75,71 @@ class Schema(pydantic.BaseModel):
 
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> Schema:
-        """Create a Schema from a dictionary, handling nested schemas."""
-        excluded = {
-            "title",
-            "type",
-            "description",
-            "required",
-            "properties",
-            "items",
-            "allOf",
-            "oneOf",
-            "anyOf",
-            "not",
-        }
-
-        return cls(
-            title=data.get("title"),
-            type=data.get("type"),
-            description=data.get("description"),
-            required=data.get("required", []),
-            properties=model_utils.parse_collection(data, "properties", cls.from_dict),
-            items=model_utils.parse_nested_object(data, "items", cls.from_dict),
-            allOf=model_utils.parse_list_or_none(data, "allOf", cls.from_dict),
-            oneOf=model_utils.parse_list_or_none(data, "oneOf", cls.from_dict),
-            anyOf=model_utils.parse_list_or_none(data, "anyOf", cls.from_dict),
-            # Use dict unpacking for 'not' since it's a Python keyword
-            **{"not": model_utils.parse_nested_object(data, "not", cls.from_dict)} if "not" in data else {},
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        """Create a Schema from a dictionary, handling nested schemas.
+
+        Nested schemas are built bottom-up from an explicit work stack rather than by
+        recursion, so deeply nested schemas don't run into Python's recursion limit.
+        A dict that appears more than once in the tree (e.g. a YAML anchor and its
+        aliases) gets a separate Schema at each position.
+
+        Raises:
+            ValueError: If a schema dict contains itself, e.g. through a recursive YAML alias
+        """
+        results: list[Schema] = []
+        # Ids of dicts whose children are still being built; meeting one again means a cycle.
+        # The dicts stay alive in data for the whole call, so ids are stable
+        in_progress: set[int] = set()
+        # Entries are (schema dict, None) when still to be expanded, or
+        # (schema dict, nested schemas) once its children have been queued
+        stack: list[tuple[dict[str, typing.Any], list[tuple[str, str | None, dict[str, typing.Any]]] | None]] = [
+            (data, None)
+        ]
+        while stack:
+            node, nested = stack.pop()
+            if nested is None:
+                if id(node) in in_progress:
+                    raise ValueError("Schema contains itself (recursive YAML alias?); use $ref for recursive schemas")
+                nested = _nested_schemas(node)
+                if nested:
+                    in_progress.add(id(node))
+                    stack.append((node, nested))
+                    stack.extend((item_data, None) for _, _, item_data in reversed(nested))
+                    continue
+            # The children of this node are the last len(nested) results, in order
+            split = len(results) - len(nested)
+            children = results[split:]
+            del results[split:]
+            schema = cls._assemble(node, nested, children)
+            in_progress.discard(id(node))
+            results.append(schema)
+        return results[0]
+
+    @classmethod
+    def _assemble(
+        cls,
+        data: dict[str, typing.Any],
+        nested: list[tuple[str, str | None, dict[str, typing.Any]]],
+        children: list[Schema],
+    ) -> Schema:
+        """Create a Schema from its dictionary and its already-built nested schemas."""
+        fields = {k: v for k, v in data.items() if k not in NESTED_SCHEMA_KEYWORDS}
+        # Copy the declared list fields, as validation would, so that a dict repeated in the
+        # tree doesn't leave its Schemas sharing one list
+        for keyword in LIST_VALUE_KEYWORDS:
+            if isinstance(fields.get(keyword), list):
+                fields[keyword] = list(fields[keyword])
+        if "properties" in data:
+            fields["properties"] = {}
+        for keyword in SCHEMA_LIST_KEYWORDS:
+            if isinstance(data.get(keyword), list):
+                fields[keyword] = []
+
+        for (keyword, name, _), child in zip(nested, children):
+            if keyword == "properties":
+                fields["properties"][name] = child
+            elif keyword in SCHEMA_LIST_KEYWORDS:
+                fields[keyword].append(child)
+            else:
+                fields[keyword] = child
+
+        return model_utils.construct_model(cls, **fields)
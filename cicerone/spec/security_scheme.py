@@ -18,7 +18,7 @@ class SecurityScheme(pydantic.BaseModel):
     """Represents an OpenAPI security scheme object."""
 
     # Allow extra fields to support vendor extensions and future spec additions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     type: str | None = None
     description: str | None = None
@@ -32,15 +32,7 @@ class SecurityScheme(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> "SecurityScheme":
         """Create a SecurityScheme from a dictionary."""
-        excluded = {"type", "description", "name", "in", "scheme", "bearerFormat", "flows", "openIdConnectUrl"}
-        return cls(
-            type=data.get("type"),
-            description=data.get("description"),
-            name=data.get("name"),
-            **{"in": data.get("in")},
-            scheme=data.get("scheme"),
-            bearerFormat=data.get("bearerFormat"),
-            flows=model_utils.parse_nested_object(data, "flows", spec_oauth_flows.OAuthFlows.from_dict),
-            openIdConnectUrl=data.get("openIdConnectUrl"),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        fields = dict(data)
+        if "flows" in data:
+            fields["flows"] = spec_oauth_flows.OAuthFlows.from_dict(data["flows"])
+        return model_utils.construct_model(cls, **fields)
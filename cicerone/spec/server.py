@@ -18,7 +18,7 @@ class ServerVariable(pydantic.BaseModel):
     """Represents a server variable for use in server URL template substitution."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     enum: list[str] = pydantic.Field(default_factory=list)
     default: str
@@ -27,20 +27,15 @@ class ServerVariable(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> ServerVariable:
         """Create a ServerVariable from a dictionary."""
-        excluded = {"enum", "default", "description"}
-        return cls(
-            enum=data.get("enum", []),
-            default=data["default"],
-            description=data.get("description"),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        model_utils.require_fields(data, "default")
+        return model_utils.construct_model(cls, **data)
 
 
 class Server(pydantic.BaseModel):
     """Represents an OpenAPI Server object."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     url: str
     description: str | None = None
@@ -58,10 +53,6 @@ class Server(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> Server:
         """Create a Server from a dictionary."""
-        excluded = {"url", "description", "variables"}
-        return cls(
-            url=data["url"],
-            description=data.get("description"),
-            variables=model_utils.parse_collection(data, "variables", ServerVariable.from_dict),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        model_utils.require_fields(data, "url")
+        fields = model_utils.parse_collections(data, {"variables": ServerVariable.from_dict})
+        return model_utils.construct_model(cls, **fields)
@@ -17,7 +17,7 @@ class ExternalDocumentation(pydantic.BaseModel):
     """Represents external documentation."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     url: str
     description: str | None = None
@@ -25,19 +25,15 @@ class ExternalDocumentation(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> ExternalDocumentation:
         """Create ExternalDocumentation from a dictionary."""
-        excluded = {"url", "description"}
-        return cls(
-            url=data["url"],
-            description=data.get("description"),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        model_utils.require_fields(data, "url")
+        return model_utils.construct_model(cls, **data)
 
 
 class Tag(pydantic.BaseModel):
     """Represents an OpenAPI Tag object."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     name: str
     description: str | None = None
@@ -53,10 +49,8 @@ class Tag(pydantic.BaseModel):
     @classmethod
     def from_dict(cls, data: dict[str, typing.Any]) -> Tag:
         """Create a Tag from a dictionary."""
-        excluded = {"name", "description", "externalDocs"}
-        return cls(
-            name=data["name"],
-            description=data.get("description"),
-            external_docs=model_utils.parse_nested_object(data, "externalDocs", ExternalDocumentation.from_dict),
-            **{k: v for k, v in data.items() if k not in excluded},
-        )
+        model_utils.require_fields(data, "name")
+        fields = dict(data)
+        if "externalDocs" in fields:
+            fields["external_docs"] = ExternalDocumentation.from_dict(fields.pop("externalDocs"))
+        return model_utils.construct_model(cls, **fields)
@@ -6,19 +6,67 @@ References:
 
 from __future__ import annotations
 
+import functools
+
 
 class Version:
-    """Simple version representation for OpenAPI specs."""
+    """Simple version representation for OpenAPI specs.
+
+    Versions are read-only, since parse_version() shares one instance between every spec
+    declaring the same version string.
+    """
+
+    __slots__ = ("_raw", "_major", "_minor", "_patch")
 
     def __init__(self, version_string: str):
-        self.raw = version_string
+        self._raw = version_string
         parts = version_string.split(".")
-        self.major = int(parts[0]) if len(parts) > 0 and parts[0].isdigit() else 0
-        self.minor = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
-        self.patch = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
+        self._major = int(parts[0]) if len(parts) > 0 and parts[0].isdigit() else 0
+        self._minor = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+        self._patch = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
+
+    @property
+    def raw(self) -> str:
+        """The version string as written in the spec."""
+        return self._raw
+
+    @property
+    def major(self) -> int:
+        """The major version number, or 0 if it is missing or not numeric."""
+        return self._major
+
+    @property
+    def minor(self) -> int:
+        """The minor version number, or 0 if it is missing or not numeric."""
+        return self._minor
+
+    @property
+    def patch(self) -> int:
+        """The patch version number, or 0 if it is missing or not numeric."""
+        return self._patch
 
     def __str__(self) -> str:
         return self.raw
 
     def __repr__(self) -> str:
         return f"Version('{self.raw}')"
+
+
+@functools.lru_cache(maxsize=256)
+def parse_version(version_string: str) -> Version:
+    """Parse a version string, reusing the Version already built for the same string.
+
+    Nearly every spec declares one of a handful of versions (e.g. "3.0.0"), so repeat parses are free.
+    The returned Version is shared between callers, which is safe because Versions are read-only.
+
+    Args:
+        version_string: The version string, e.g. "3.1.0"
+
+    Returns:
+        Version object for the string
+
+    Example:
+        >>> parse_version("3.1.0").minor
+        1
+    """
+    return Version(version_string)
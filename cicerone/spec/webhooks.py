@@ -6,10 +6,12 @@ References:
 
 from __future__ import annotations
 
+import itertools
 import typing
 
 import pydantic
 
+from cicerone.spec import model_utils
 from cicerone.spec import operation as spec_operation
 from cicerone.spec import path_item as spec_path_item
 
@@ -18,7 +20,7 @@ class Webhooks(pydantic.BaseModel):
     """Container for webhook definitions (OpenAPI 3.1+)."""
 
     # Allow extra fields to support vendor extensions
-    model_config = {"extra": "allow"}
+    model_config = {"extra": "allow", "defer_build": True}
 
     items: dict[str, spec_path_item.PathItem] = pydantic.Field(default_factory=dict)
 
@@ -26,7 +28,7 @@ class Webhooks(pydantic.BaseModel):
         """Return a readable string representation of webhooks."""
         if not self.items:
             return "<Webhooks: empty>"
-        webhook_list = ", ".join(list(self.items.keys())[:3])
+        webhook_list = ", ".join(itertools.islice(self.items, 3))
         if len(self.items) > 3:
             webhook_list += f" (+{len(self.items) - 3} more)"
         return f"<Webhooks: {len(self.items)} webhooks [{webhook_list}]>"
@@ -50,4 +52,4 @@ class Webhooks(pydantic.BaseModel):
             # We use a webhook: prefix to distinguish these from real API paths
             # This is internal to cicerone and not part of the OpenAPI spec
             items[webhook_name] = spec_path_item.PathItem.from_dict(f"webhook:{webhook_name}", webhook_data)
-        return cls(items=items)
+        return model_utils.construct_model(cls, items=items)
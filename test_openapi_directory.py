@@ -9,11 +9,16 @@ This script:
 """
 
 import argparse
+import hashlib
+import multiprocessing
+import os
 import pathlib
+import re
 import shutil
 import subprocess
 import sys
-from typing import List, Tuple
+import traceback
+from typing import Dict, List, Tuple
 
 from cicerone import parse as cicerone_parse
 
@@ -38,15 +43,49 @@ def find_schema_files(base_dir: pathlib.Path) -> List[pathlib.Path]:
     if not apis_dir.exists():
         raise RuntimeError(f"APIs directory not found at {apis_dir}")
 
-    # Find all .yaml and .json files
-    for pattern in ["**/*.yaml", "**/*.json"]:
-        schema_files.extend(apis_dir.glob(pattern))
+    # Find all .yaml and .json files in a single walk of the tree
+    schema_files.extend(path for path in apis_dir.rglob("*") if path.suffix in (".yaml", ".json"))
 
     print(f"Found {len(schema_files)} schema files")
+    # Sorted so that --limit picks the same schemas on every run
     return sorted(schema_files)
 
 
+# Results of files already tested in this process, keyed by (file extension, content digest).
+# The directory holds many byte-identical copies (e.g. unchanged version snapshots) which
+# are bound to give the same result, so each distinct file is only parsed once. Failures
+# aren't stored: they are rare, and their messages and tracebacks name the original file.
+_RESULTS_BY_CONTENT: Dict[Tuple[str, bytes], Tuple[str, str, Exception | None]] = {}
+
+
+# A top-level `swagger: 2.x` (YAML) or `"swagger": "2.x"` (JSON) key, as found near the start of Swagger 2 files
+_SWAGGER_2_PATTERN = re.compile(rb"""(?:^|[{,]\s*)["']?swagger["']?\s*:\s*["']?(2(?:\.\d+)*)""", re.MULTILINE)
+_SWAGGER_PEEK_BYTES = 4096
+
+
 def test_schema_file(schema_path: pathlib.Path) -> Tuple[str, str, Exception | None]:
+    """Test parsing a single schema file, reusing the result for identical files.
+
+    Swagger 2.x files are recognised from their first few KB and skipped without being parsed.
+
+    Returns:
+        Tuple of (status: str, error_message: str, exception: Exception | None)
+        where status is one of: "success", "skipped", "failed"
+    """
+    content = schema_path.read_bytes()
+    if match := _SWAGGER_2_PATTERN.search(content, 0, _SWAGGER_PEEK_BYTES):
+        version_str = match.group(1).decode()
+        return "skipped", f"Swagger {version_str} (not supported, cicerone requires OpenAPI 3.x)", None
+
+    content_key = (schema_path.suffix.lower(), hashlib.blake2b(content, digest_size=16).digest())
+    if (result := _RESULTS_BY_CONTENT.get(content_key)) is None:
+        result = _parse_schema_file(schema_path)
+        if result[0] != "failed":
+            _RESULTS_BY_CONTENT[content_key] = result
+    return result
+
+
+def _parse_schema_file(schema_path: pathlib.Path) -> Tuple[str, str, Exception | None]:
     """Test parsing a single schema file.
 
     Returns:
@@ -78,54 +117,98 @@ def test_schema_file(schema_path: pathlib.Path) -> Tuple[str, str, Exception | N
         return "failed", f"{type(e).__name__}: {str(e)}", e
 
 
+def _test_schema_file_in_worker(schema_path: pathlib.Path) -> Tuple[pathlib.Path, str, str, str | None]:
+    """Test a single schema file in a worker process.
+
+    Exceptions (and their tracebacks) don't reliably survive pickling back to the main
+    process, so the traceback is formatted here and returned as text instead.
+
+    Returns:
+        Tuple of (schema_path, status: str, error_message: str, traceback_text: str | None)
+    """
+    status, error, exception = test_schema_file(schema_path)
+    details = None
+    if exception is not None:
+        details = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+    return schema_path, status, error, details
+
+
 def test_all_schemas(
-    schema_files: List[pathlib.Path], base_dir: pathlib.Path, verbose: bool = False, fail_fast: bool = False
-) -> Tuple[int, int, int, List[Tuple[pathlib.Path, str, Exception | None]], List[Tuple[pathlib.Path, str]]]:
+    schema_files: List[pathlib.Path],
+    base_dir: pathlib.Path,
+    verbose: bool = False,
+    fail_fast: bool = False,
+    workers: int | None = None,
+) -> Tuple[int, int, int, List[Tuple[pathlib.Path, str, str | None]], List[Tuple[pathlib.Path, str]]]:
     """Test parsing all schema files.
 
+    Schemas are independent, so they are parsed in a pool of worker processes and
+    results are handled in the main process as soon as each one finishes, in whatever
+    order that is. The returned failures and skipped lists are sorted by path.
+
     Returns:
         Tuple of (success_count, skipped_count, failure_count, failures_list, skipped_list)
     """
-    print(f"\nTesting {len(schema_files)} schemas...")
+    workers = workers or os.cpu_count() or 1
+    print(f"\nTesting {len(schema_files)} schemas using {workers} worker processes...")
     successes = 0
     skipped = []
     failures = []
 
-    for i, schema_path in enumerate(schema_files, 1):
-        if verbose or i % 100 == 0:
-            print(
-                f"Progress: {i}/{len(schema_files)} ({successes} successful, "
-                f"{len(skipped)} skipped, {len(failures)} failed)"
-            )
-
-        status, error, exception = test_schema_file(schema_path)
-        if status == "success":
-            successes += 1
-            if verbose:
-                print(f"  ✓ {schema_path.relative_to(base_dir)}")
-        elif status == "skipped":
-            skipped.append((schema_path, error))
-            if verbose:
-                print(f"  ⊘ {schema_path.relative_to(base_dir)}: {error}")
-        else:  # failed
-            failures.append((schema_path, error, exception))
-            if verbose:
-                print(f"  ✗ {schema_path.relative_to(base_dir)}: {error}")
-
-            if fail_fast:
-                print(f"\n{'=' * 80}")
-                print("FAIL FAST MODE - Stopping on first error")
-                print(f"{'=' * 80}")
-                print(f"Failed schema: {schema_path.relative_to(base_dir)}")
-                print(f"Error: {error}")
-                if exception:
-                    print("\nFull error details:")
-                    import traceback
-
-                    traceback.print_exception(type(exception), exception, exception.__traceback__)
-                print(f"\nSchema location: {schema_path}")
-                break
-
+    # Progress lines are collected and written out in batches rather than one write per line
+    output: List[str] = []
+
+    def flush_output() -> None:
+        if output:
+            output.append("")
+            sys.stdout.write("\n".join(output))
+            sys.stdout.flush()
+            output.clear()
+
+    # Large enough chunks to keep inter-process overhead low, small enough to balance the load
+    chunksize = max(1, min(32, len(schema_files) // (workers * 8)))
+    with multiprocessing.Pool(processes=workers) as pool:
+        results = pool.imap_unordered(_test_schema_file_in_worker, schema_files, chunksize=chunksize)
+        for i, (schema_path, status, error, details) in enumerate(results, 1):
+            if verbose or i % 100 == 0:
+                output.append(
+                    f"Progress: {i}/{len(schema_files)} ({successes} successful, "
+                    f"{len(skipped)} skipped, {len(failures)} failed)"
+                )
+
+            if status == "success":
+                successes += 1
+                if verbose:
+                    output.append(f"  ✓ {schema_path.relative_to(base_dir)}")
+            elif status == "skipped":
+                skipped.append((schema_path, error))
+                if verbose:
+                    output.append(f"  ⊘ {schema_path.relative_to(base_dir)}: {error}")
+            else:  # failed
+                failures.append((schema_path, error, details))
+                if verbose:
+                    output.append(f"  ✗ {schema_path.relative_to(base_dir)}: {error}")
+
+                if fail_fast:
+                    flush_output()
+                    print(f"\n{'=' * 80}")
+                    print("FAIL FAST MODE - Stopping on first error")
+                    print(f"{'=' * 80}")
+                    print(f"Failed schema: {schema_path.relative_to(base_dir)}")
+                    print(f"Error: {error}")
+                    if details:
+                        print("\nFull error details:")
+                        print(details, end="")
+                    print(f"\nSchema location: {schema_path}")
+                    # Leaving the with block terminates the pool, dropping any queued schemas
+                    break
+
+            if i % 100 == 0:
+                flush_output()
+
+    flush_output()
+    skipped.sort(key=lambda item: item[0])
+    failures.sort(key=lambda item: item[0])
     return successes, len(skipped), len(failures), failures, skipped
 
 
@@ -144,6 +227,9 @@ def main() -> int:
     parser.add_argument(
         "-x", "--fail-fast", action="store_true", help="Stop on first failure and print detailed error info"
     )
+    parser.add_argument(
+        "--workers", type=int, help="Number of worker processes to parse schemas with (default: number of CPUs)"
+    )
     args = parser.parse_args()
 
     repo_dir = args.repo_dir
@@ -165,7 +251,7 @@ def main() -> int:
 
         # Test all schemas
         successes, skipped_count, failures_count, failures, skipped = test_all_schemas(
-            schema_files, repo_dir, verbose=args.verbose, fail_fast=args.fail_fast
+            schema_files, repo_dir, verbose=args.verbose, fail_fast=args.fail_fast, workers=args.workers
         )
 
         # Print summary
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import gzip
+import io
 import json
+import os
 import pathlib
 from unittest import mock
+from urllib import error as urllib_error
+
+import pytest
+import yaml
 
 from cicerone import parse as cicerone_parse
+from cicerone import settings
 
 
 class TestParser:
@@ -22,6 +30,19 @@ class TestParser:
         spec = cicerone_parse.parse_spec_from_dict(data)
         assert spec.version.major == 3
 
+    def test_parse_from_dict_keeps_document_without_copying(self, monkeypatch):
+        """Test that the parsed document is kept as raw rather than copied."""
+        # Pydantic validation (CICERONE_VALIDATE=1) copies dict fields, so check the default path
+        monkeypatch.setattr(settings, "VALIDATE_MODELS", False)
+        data = {
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0.0"},
+            "paths": {},
+        }
+        spec = cicerone_parse.parse_spec_from_dict(data)
+        assert spec.raw is data
+        assert "'Test'" in str(spec)
+
     def test_parse_from_json(self):
         """Test parsing from JSON string."""
         json_str = json.dumps(
@@ -34,6 +55,43 @@ class TestParser:
         spec = cicerone_parse.parse_spec_from_json(json_str)
         assert spec.version.major == 3
 
+    def test_parse_from_json_bytes(self):
+        """Test parsing from UTF-8 encoded JSON bytes."""
+        json_bytes = json.dumps(
+            {
+                "openapi": "3.0.0",
+                "info": {"title": "Tëst", "version": "1.0.0"},
+                "paths": {},
+            }
+        ).encode("utf-8")
+        spec = cicerone_parse.parse_spec_from_json(json_bytes)
+        assert spec.info.title == "Tëst"
+
+    def test_parse_from_json_uses_module_loader(self):
+        """Test that JSON parsing goes through the swappable module-level loader."""
+        data = {"openapi": "3.1.0", "info": {"title": "Test", "version": "1.0.0"}, "paths": {}}
+        loader = mock.Mock(return_value=data)
+        with mock.patch("cicerone.parse.parser._JSON_LOADS", loader):
+            spec = cicerone_parse.parse_spec_from_json("{}")
+        loader.assert_called_once_with("{}")
+        assert spec.version.minor == 1
+
+    def test_parse_from_json_uses_orjson_when_installed(self):
+        """Test that orjson is picked as the JSON loader when it can be imported."""
+        orjson = pytest.importorskip("orjson")
+        assert cicerone_parse.parser._JSON_LOADS is orjson.loads
+
+    @pytest.mark.parametrize("loader_module", ["json", "orjson"])
+    def test_parse_from_file_json_fallback_to_yaml_with_each_loader(self, tmp_path, loader_module):
+        """Test that a JSON decode error from either loader falls back to YAML."""
+        loads = pytest.importorskip(loader_module).loads
+        file_path = tmp_path / "spec.json"
+        file_path.write_text('openapi: "3.0.0"\ninfo:\n  title: Test\n  version: "1.0.0"\npaths: {}\n')
+
+        with mock.patch("cicerone.parse.parser._JSON_LOADS", loads):
+            spec = cicerone_parse.parse_spec_from_file(file_path)
+        assert spec.info.title == "Test"
+
     def test_parse_from_yaml(self):
         """Test parsing from YAML string."""
         yaml_str = """
@@ -46,6 +104,13 @@ paths: {}
         spec = cicerone_parse.parse_spec_from_yaml(yaml_str)
         assert spec.version.major == 3
 
+    def test_parse_from_yaml_pure_python_loader(self):
+        """Test YAML parsing still works when libyaml is unavailable."""
+        yaml_str = 'openapi: "3.0.0"\ninfo:\n  title: Test\n  version: "1.0.0"\npaths: {}\n'
+        with mock.patch("cicerone.parse.parser._YAML_LOADER", yaml.SafeLoader):
+            spec = cicerone_parse.parse_spec_from_yaml(yaml_str)
+        assert spec.info.title == "Test"
+
     def test_parse_from_file_yaml(self):
         """Test parsing YAML file."""
         fixture_path = pathlib.Path(__file__).parent.parent / "fixtures" / "petstore_openapi3.yaml"
@@ -76,6 +141,20 @@ paths: {}
             assert spec.version.major == 3
             assert "/test" in spec.paths
 
+    def test_parse_from_url_gzip(self):
+        """Test that gzip-encoded responses are requested and decompressed."""
+        json_spec = {"openapi": "3.0.0", "info": {"title": "Test", "version": "1.0.0"}, "paths": {"/test": {}}}
+        mock_response = mock.Mock()
+        mock_response.read.return_value = gzip.compress(json.dumps(json_spec).encode("utf-8"))
+        mock_response.headers = {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        mock_response.__enter__ = mock.Mock(return_value=mock_response)
+        mock_response.__exit__ = mock.Mock(return_value=False)
+        with mock.patch("cicerone.parse.parser.urllib_request.urlopen", return_value=mock_response) as urlopen:
+            spec = cicerone_parse.parse_spec_from_url("https://example.com/openapi.json")
+
+        assert "/test" in spec.paths
+        assert urlopen.call_args.args[0].get_header("Accept-encoding") == "gzip"
+
     def test_parse_from_url_yaml(self):
         """Test loading spec from URL with YAML content."""
         yaml_spec = """
@@ -137,3 +216,75 @@ paths:
             spec = cicerone_parse.parse_spec_from_url("https://example.com/openapi.json")
             assert spec.version.major == 3
             assert "/test" in spec.paths
+
+
+class TestParserCache:
+    """Tests for caching of parsed files and URLs."""
+
+    def setup_method(self):
+        cicerone_parse.clear_cache()
+
+    def test_file_cache_returns_same_spec(self, tmp_path):
+        """Test that an unchanged file is only parsed once."""
+        file_path = tmp_path / "spec.json"
+        file_path.write_text(json.dumps({"openapi": "3.0.0", "info": {"title": "A", "version": "1"}, "paths": {}}))
+
+        first = cicerone_parse.parse_spec_from_file(file_path, cache=True)
+        second = cicerone_parse.parse_spec_from_file(str(file_path), cache=True)
+        assert second is first
+
+    def test_file_not_cached_by_default(self, tmp_path):
+        """Test that each call parses a fresh spec unless caching is requested."""
+        file_path = tmp_path / "spec.json"
+        file_path.write_text(json.dumps({"openapi": "3.0.0", "info": {"title": "A", "version": "1"}, "paths": {}}))
+
+        first = cicerone_parse.parse_spec_from_file(file_path)
+        second = cicerone_parse.parse_spec_from_file(file_path)
+        assert second is not first
+        # Nothing was stored, so an opted-in call parses the file as well
+        third = cicerone_parse.parse_spec_from_file(file_path, cache=True)
+        assert third is not first
+        assert third is not second
+
+    def test_file_cache_invalidated_on_change(self, tmp_path):
+        """Test that a modified file is parsed again."""
+        file_path = tmp_path / "spec.json"
+        file_path.write_text(json.dumps({"openapi": "3.0.0", "info": {"title": "A", "version": "1"}, "paths": {}}))
+        first = cicerone_parse.parse_spec_from_file(file_path, cache=True)
+
+        file_path.write_text(json.dumps({"openapi": "3.0.0", "info": {"title": "Bb", "version": "1"}, "paths": {}}))
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = cicerone_parse.parse_spec_from_file(file_path, cache=True)
+        assert second is not first
+        assert second.info.title == "Bb"
+
+    def test_clear_cache(self, tmp_path):
+        """Test that clear_cache forces a fresh parse."""
+        file_path = tmp_path / "spec.json"
+        file_path.write_text(json.dumps({"openapi": "3.0.0", "info": {"title": "A", "version": "1"}, "paths": {}}))
+        first = cicerone_parse.parse_spec_from_file(file_path, cache=True)
+        cicerone_parse.clear_cache()
+        assert cicerone_parse.parse_spec_from_file(file_path, cache=True) is not first
+
+    def test_url_cache_revalidates_with_etag(self):
+        """Test that a URL with an ETag is revalidated and reused on 304 Not Modified."""
+        url = "https://example.com/cached.json"
+        mock_response = mock.Mock()
+        mock_response.read.return_value = json.dumps(
+            {"openapi": "3.0.0", "info": {"title": "A", "version": "1"}, "paths": {}}
+        ).encode("utf-8")
+        mock_response.headers = {"Content-Type": "application/json", "ETag": '"v1"'}
+        mock_response.__enter__ = mock.Mock(return_value=mock_response)
+        mock_response.__exit__ = mock.Mock(return_value=False)
+        not_modified = urllib_error.HTTPError(url, 304, "Not Modified", {}, io.BytesIO())
+
+        with mock.patch(
+            "cicerone.parse.parser.urllib_request.urlopen", side_effect=[mock_response, not_modified]
+        ) as urlopen:
+            first = cicerone_parse.parse_spec_from_url(url, cache=True)
+            second = cicerone_parse.parse_spec_from_url(url, cache=True)
+
+        assert second is first
+        conditional_request = urlopen.call_args_list[1].args[0]
+        assert conditional_request.get_header("If-none-match") == '"v1"'
@@ -25,6 +25,28 @@ class TestParameter:
         assert param.schema_ is not None
         assert param.schema_.type == "integer"
 
+    def test_parameter_from_dict_defaults_and_extensions(self):
+        """Test Parameter defaults, nested examples and vendor extensions."""
+        data = {
+            "name": "id",
+            "in": "path",
+            "examples": {"one": {"value": 1}},
+            "x-internal": True,
+        }
+        param = cicerone_spec.Parameter.from_dict(data)
+        assert param.required is False
+        assert param.schema_ is None
+        assert param.examples["one"].value == 1
+        assert param.model_extra == {"x-internal": True}
+
+    def test_parameter_location_and_style_are_interned(self):
+        """Test that repeated parameter strings share one object."""
+        # Build the strings at runtime so they start out as distinct objects
+        first = cicerone_spec.Parameter.from_dict({"name": "".join(["pa", "ge"]), "in": "".join(["qu", "ery"])})
+        second = cicerone_spec.Parameter.from_dict({"name": "".join(["pag", "e"]), "in": "".join(["que", "ry"])})
+        assert first.name is second.name
+        assert first.in_ is second.in_
+
 
 class TestResponse:
     """Tests for Response model."""
@@ -84,6 +106,13 @@ class TestSecurityScheme:
         assert scheme.name == "X-API-Key"
         assert scheme.in_ == "header"
 
+    def test_security_scheme_extensions_kept_as_extras(self):
+        """Test that vendor extensions are kept alongside the known fields."""
+        data = {"type": "apiKey", "name": "key", "in": "query", "x-rate-limited": True}
+        scheme = cicerone_spec.SecurityScheme.from_dict(data)
+        assert scheme.in_ == "query"
+        assert scheme.model_extra == {"x-rate-limited": True}
+
 
 class TestExample:
     """Tests for Example model."""
@@ -112,3 +141,9 @@ class TestHeader:
         assert header.description == "Rate limit header"
         assert header.schema_ is not None
         assert header.schema_.type == "integer"
+
+    def test_header_model_validate_resolves_deferred_schema(self):
+        """Test that validating a Header builds its deferred validator, including the Schema reference."""
+        header = cicerone_spec.Header.model_validate({"schema": {"type": "integer"}})
+        assert isinstance(header.schema_, cicerone_spec.Schema)
+        assert header.schema_.type == "integer"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from cicerone import spec as cicerone_spec
 
 
@@ -60,6 +62,11 @@ class TestLicense:
         assert license.name == "MIT"
         assert license.identifier == "MIT"
 
+    def test_license_missing_name(self):
+        """Test that a License without a name is rejected."""
+        with pytest.raises(KeyError, match="name"):
+            cicerone_spec.License.from_dict({"url": "https://opensource.org/licenses/MIT"})
+
 
 class TestInfo:
     """Tests for Info model."""
@@ -76,6 +83,11 @@ class TestInfo:
         assert info.summary is None
         assert info.description is None
 
+    def test_info_missing_title(self):
+        """Test that an Info object without a title is rejected."""
+        with pytest.raises(KeyError, match="title"):
+            cicerone_spec.Info.from_dict({"version": "1.0.0"})
+
     def test_info_complete(self):
         """Test creating complete Info object."""
         data = {
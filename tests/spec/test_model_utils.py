@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import pydantic
+import pytest
+
+from cicerone import settings
 from cicerone.spec import model_utils
 
 
@@ -106,3 +110,48 @@ class TestParseCollection:
         assert "Address" in result
         assert result["User"]["parsed"] is True
         assert result["Address"]["parsed"] is True
+
+
+class TestParseCollections:
+    """Tests for parse_collections function."""
+
+    def test_parse_collections_replaces_present_collections(self):
+        """Test that present collections are parsed and other keys are copied as-is."""
+        data = {"description": "OK", "content": {"a": {"value": 1}}, "x-extra": True}
+        result = model_utils.parse_collections(data, {"content": dummy_parser, "headers": dummy_parser})
+        assert result == {"description": "OK", "content": {"a": {"value": 1, "parsed": True}}, "x-extra": True}
+        # Missing collections are not added, and the source is left untouched
+        assert "headers" not in result
+        assert data["content"] == {"a": {"value": 1}}
+
+
+class AliasedModel(pydantic.BaseModel):
+    """Small model for testing construct_model."""
+
+    model_config = {"extra": "allow"}
+
+    name: str
+    operation_id: str | None = pydantic.Field(None, alias="operationId")
+
+
+class TestConstructModel:
+    """Tests for construct_model function."""
+
+    def test_construct_model_maps_aliases_and_extras(self):
+        """Test that aliased and extra fields are populated without validation."""
+        model = model_utils.construct_model(AliasedModel, name="test", operationId="getTest", **{"x-vendor": 1})
+        assert model.name == "test"
+        assert model.operation_id == "getTest"
+        assert model.__pydantic_extra__ == {"x-vendor": 1}
+
+    def test_construct_model_skips_validation(self, monkeypatch):
+        """Test that values are trusted as-is by default."""
+        monkeypatch.setattr(settings, "VALIDATE_MODELS", False)
+        model = model_utils.construct_model(AliasedModel, name=123)
+        assert model.name == 123
+
+    def test_construct_model_validates_when_enabled(self, monkeypatch):
+        """Test that CICERONE_VALIDATE restores pydantic validation."""
+        monkeypatch.setattr(settings, "VALIDATE_MODELS", True)
+        with pytest.raises(pydantic.ValidationError):
+            model_utils.construct_model(AliasedModel, name=123)
@@ -6,6 +6,7 @@ import json
 import pathlib
 
 from cicerone import parse as cicerone_parse
+from cicerone import spec as cicerone_spec
 
 
 class TestOpenAPISpec:
@@ -166,6 +167,68 @@ paths:
         op = spec.operation_by_operation_id("nonExistent")
         assert op is None
 
+    def test_operation_by_operation_id_duplicate_returns_first(self):
+        """Test that the first operation wins when operationIds are duplicated."""
+        data = {
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0.0"},
+            "paths": {
+                "/users": {"get": {"operationId": "dupe"}},
+                "/posts": {"get": {"operationId": "dupe"}},
+            },
+        }
+        spec = cicerone_parse.parse_spec_from_dict(data)
+
+        op = spec.operation_by_operation_id("dupe")
+        assert op is not None
+        assert op.path == "/users"
+        # Repeated lookups are served from the same index
+        assert spec.operation_by_operation_id("dupe") is op
+
+    def test_operation_by_operation_id_after_invalidate_caches(self):
+        """Test that the operationId index is rebuilt after the paths change."""
+        data = {
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0.0"},
+            "paths": {"/users": {"get": {"operationId": "listUsers"}}},
+        }
+        spec = cicerone_parse.parse_spec_from_dict(data)
+        assert spec.operation_by_operation_id("listUsers") is not None
+
+        del spec.paths.items["/users"]
+        spec.paths.items["/posts"] = cicerone_spec.PathItem.from_dict("/posts", {"get": {"operationId": "listPosts"}})
+        spec.invalidate_caches()
+
+        assert spec.operation_by_operation_id("listUsers") is None
+        op = spec.operation_by_operation_id("listPosts")
+        assert op is not None
+        assert op.path == "/posts"
+
+    def test_build_operation_id_index_across_specs(self):
+        """Test building one operationId index over several specs."""
+        users = cicerone_parse.parse_spec_from_dict(
+            {
+                "openapi": "3.0.0",
+                "info": {"title": "Users", "version": "1.0.0"},
+                "paths": {"/users": {"get": {"operationId": "listUsers"}, "post": {"operationId": "shared"}}},
+            }
+        )
+        billing = cicerone_parse.parse_spec_from_dict(
+            {
+                "openapi": "3.0.0",
+                "info": {"title": "Billing", "version": "1.0.0"},
+                "paths": {"/invoices": {"get": {"operationId": "listInvoices"}, "post": {"operationId": "shared"}}},
+            }
+        )
+        index = cicerone_spec.OpenAPISpec.build_operation_id_index([users, billing])
+
+        assert set(index) == {"listUsers", "listInvoices", "shared"}
+        spec, op = index["listInvoices"]
+        assert spec is billing
+        assert op is billing.operation_by_operation_id("listInvoices")
+        # The first spec wins for duplicated operationIds
+        assert index["shared"][0] is users
+
     def test_all_operations(self):
         """Test iterating all operations."""
         data = {
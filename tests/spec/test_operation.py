@@ -52,3 +52,9 @@ class TestOperation:
         assert "POST /posts" in str_repr
         # Should not include operationId, summary, or tags if not present
         assert "id=" not in str_repr or "id=None" not in str_repr
+
+    def test_operation_tags_are_shared_strings(self):
+        """Test that identical tag names across operations share one string object."""
+        first = cicerone_spec.Operation.from_dict("GET", "/users", {"tags": ["".join(["us", "ers"])]})
+        second = cicerone_spec.Operation.from_dict("POST", "/users", {"tags": ["".join(["use", "rs"])]})
+        assert first.tags[0] is second.tags[0]
@@ -1,5 +1,9 @@
 """Tests for the Reference model and reference resolution."""
 
+import sys
+from unittest import mock
+
+import pydantic
 import pytest
 
 from cicerone.parse import parse_spec_from_dict, parse_spec_from_file
@@ -37,6 +41,22 @@ class TestReference:
         assert ref.ref == "#/components/schemas/Pet"
         assert ref.summary == "Pet reference"
 
+    def test_reference_from_dict_keeps_extras_and_input(self):
+        """Test that from_dict keeps extra fields, leaves the input untouched, and dumps $ref."""
+        data = {"$ref": "#/components/schemas/Pet", "x-note": "internal"}
+        ref = Reference.from_dict(data)
+        assert ref.model_extra == {"x-note": "internal"}
+        assert data == {"$ref": "#/components/schemas/Pet", "x-note": "internal"}
+        assert ref.model_dump(exclude_unset=True) == {"$ref": "#/components/schemas/Pet", "x-note": "internal"}
+
+    def test_reference_pointer_parts_are_cached(self):
+        """Test that pointer components are parsed once and the reference is immutable."""
+        ref = Reference(ref="#/components/schemas/User")
+        assert ref.pointer_parts is ref.pointer_parts
+        assert ref.pointer == "/components/schemas/User"
+        with pytest.raises(pydantic.ValidationError):
+            ref.ref = "#/components/schemas/Pet"
+
     def test_reference_from_dict_missing_ref(self):
         """Test that from_dict raises error when $ref is missing."""
         data = {"summary": "Pet reference"}
@@ -92,6 +112,14 @@ class TestReference:
         ref_no_pointer = Reference(ref="./models.yaml")
         assert ref_no_pointer.pointer_parts == []
 
+    def test_pointer_parts_unescape(self):
+        """Test that pointer parts are unescaped per RFC 6901 and percent-decoded."""
+        assert Reference(ref="#/paths/~1users~1{id}").pointer_parts == ["paths", "/users/{id}"]
+        assert Reference(ref="#/definitions/a~0b").pointer_parts == ["definitions", "a~b"]
+        # "~01" decodes to "~1", not "/"
+        assert Reference(ref="#/definitions/~01").pointer_parts == ["definitions", "~1"]
+        assert Reference(ref="#/paths/~1users~1%7Bid%7D").pointer_parts == ["paths", "/users/{id}"]
+
     def test_is_reference_static_method(self):
         """Test the is_reference static method."""
         assert Reference.is_reference({"$ref": "#/components/schemas/User"}) is True
@@ -299,6 +327,39 @@ class TestReferenceResolver:
         assert isinstance(all_refs, dict)
         assert len(all_refs) == 0
 
+    def test_pointer_navigated_once_per_ref(self):
+        """Test that each pointer is navigated once and shared through the pointer index."""
+        spec = parse_spec_from_file("tests/fixtures/petstore_openapi3.yaml")
+        pointer_index: dict = {}
+        resolver = ReferenceResolver(spec, pointer_index=pointer_index)
+
+        resolver.resolve_reference("#/components/schemas/User", follow_nested=False)
+        assert pointer_index["#/components/schemas/User"] is spec.raw["components"]["schemas"]["User"]
+
+        # A second resolver sharing the index reuses the node instead of walking spec.raw
+        with mock.patch.object(ReferenceResolver, "_navigate_pointer") as navigate:
+            ReferenceResolver(spec, pointer_index=pointer_index).resolve_reference(
+                "#/components/schemas/User", follow_nested=False
+            )
+        navigate.assert_not_called()
+
+    def test_get_all_references_deeply_nested(self):
+        """Test finding references nested deeper than the recursion limit, in document order."""
+        nested: dict = {"$ref": "#/components/schemas/Leaf"}
+        for _ in range(sys.getrecursionlimit() + 100):
+            nested = {"items": nested}
+        spec_data = {
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0.0"},
+            "paths": {},
+            "components": {"schemas": {"First": {"$ref": "#/components/schemas/A"}, "Deep": nested}},
+        }
+        spec = parse_spec_from_dict(spec_data)
+        resolver = ReferenceResolver(spec)
+
+        all_refs = resolver.get_all_references()
+        assert list(all_refs) == ["#/components/schemas/A", "#/components/schemas/Leaf"]
+
     def test_is_circular_reference(self):
         """Test checking if a reference is circular."""
         spec_data = {
@@ -330,6 +391,73 @@ class TestReferenceResolver:
         # Note: We can resolve the schema itself, but the nested ref is circular
         assert resolver.is_circular_reference("#/components/schemas/Node") is False
 
+    def test_is_circular_reference_follows_raw_chain(self):
+        """Test that circularity is decided from the raw $ref chain without building models."""
+        spec_data = {
+            "openapi": "3.0.0",
+            "info": {"title": "Test", "version": "1.0.0"},
+            "paths": {},
+            "components": {
+                "schemas": {
+                    "Self": {"$ref": "#/components/schemas/Self"},
+                    "Entry": {"$ref": "#/components/schemas/Loop1"},
+                    "Loop1": {"$ref": "#/components/schemas/Loop2"},
+                    "Loop2": {"$ref": "#/components/schemas/Loop1"},
+                    "Alias": {"$ref": "#/components/schemas/User"},
+                    "User": {"type": "object"},
+                }
+            },
+        }
+        spec = parse_spec_from_dict(spec_data)
+        resolver = ReferenceResolver(spec)
+
+        with mock.patch.object(ReferenceResolver, "_convert_to_typed_object") as convert:
+            assert resolver.is_circular_reference("#/components/schemas/Self") is True
+            # A chain that runs into a loop further along is circular too
+            assert resolver.is_circular_reference("#/components/schemas/Entry") is True
+            assert resolver.is_circular_reference("#/components/schemas/Alias") is False
+        convert.assert_not_called()
+
+        with pytest.raises(ValueError, match="Reference path not found"):
+            resolver.is_circular_reference("#/components/schemas/Missing")
+
+    def test_resolver_cache_hit_and_invalidate(self):
+        """Test that the resolver reuses cached resolutions until its cache is invalidated."""
+        spec = parse_spec_from_dict(
+            {
+                "openapi": "3.0.0",
+                "info": {"title": "Test", "version": "1.0.0"},
+                "paths": {},
+                "components": {"schemas": {"User": {"type": "object"}}},
+            }
+        )
+        resolver = ReferenceResolver(spec)
+
+        first = resolver.resolve_reference("#/components/schemas/User")
+        assert resolver.resolve_reference("#/components/schemas/User") is first
+
+        spec.raw["components"]["schemas"]["User"]["type"] = "string"
+        # Still served from the cache until it is invalidated
+        assert resolver.resolve_reference("#/components/schemas/User") is first
+
+        resolver.invalidate_cache()
+        second = resolver.resolve_reference("#/components/schemas/User")
+        assert second is not first
+        assert second.type == "string"
+
+    def test_get_ref_from_model_without_extras(self):
+        """Test that models without extras are treated as having no $ref."""
+        from cicerone.spec import Schema
+
+        class Strict(pydantic.BaseModel):
+            name: str = "x"
+
+        spec = parse_spec_from_file("tests/fixtures/petstore_openapi3.yaml")
+        resolver = ReferenceResolver(spec)
+        assert resolver._get_ref_from_model(Strict()) is None
+        assert resolver._get_ref_from_model(Reference.from_dict({"$ref": "#/a", "x": 1})) is None
+        assert resolver._get_ref_from_model(Schema.model_construct(**{"$ref": "#/a"})) == "#/a"
+
     def test_external_reference_not_supported(self):
         """Test that external references raise an appropriate error."""
         spec_data = {
@@ -442,6 +570,24 @@ class TestOpenAPISpecReferenceIntegration:
         assert user_schema.type == "object"
         assert "username" in user_schema.properties
 
+    def test_resolve_reference_from_spec_is_cached(self):
+        """Test that repeated resolutions on a spec return the cached target until invalidated."""
+        spec = parse_spec_from_dict(
+            {
+                "openapi": "3.0.0",
+                "info": {"title": "Test", "version": "1.0.0"},
+                "paths": {},
+                "components": {"schemas": {"User": {"type": "object"}}},
+            }
+        )
+
+        first = spec.resolve_reference("#/components/schemas/User")
+        assert spec.resolve_reference(Reference(ref="#/components/schemas/User")) is first
+
+        spec.raw["components"]["schemas"]["User"]["type"] = "string"
+        spec.invalidate_reference_cache()
+        assert spec.resolve_reference("#/components/schemas/User").type == "string"
+
     def test_get_all_references_from_spec(self):
         """Test getting all references directly from the spec."""
         spec = parse_spec_from_file("tests/fixtures/petstore_openapi3.yaml")
@@ -708,3 +854,55 @@ def test_resolve_single_part_reference():
     # This should return the raw data since parts < 2 after splitting
     result = resolver._convert_to_typed_object(ref, data)
     assert result == "3.0.0"
+
+
+def test_resolve_escaped_path_reference():
+    """Test resolving references that point into a path using escaped segments."""
+    from cicerone.parse import parse_spec_from_dict
+    from cicerone.spec import PathItem
+
+    spec_data = {
+        "openapi": "3.0.0",
+        "info": {"title": "Test", "version": "1.0.0"},
+        "paths": {
+            "/users/{id}": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "Success",
+                            "content": {"application/json": {"schema": {"type": "object"}}},
+                        }
+                    },
+                }
+            }
+        },
+    }
+    spec = parse_spec_from_dict(spec_data)
+
+    path_item = spec.resolve_reference("#/paths/~1users~1%7Bid%7D")
+    assert isinstance(path_item, PathItem)
+    assert path_item.path == "/users/{id}"
+
+    schema = spec.resolve_reference("#/paths/~1users~1{id}/get/responses/200/content/application~1json/schema")
+    assert schema == {"type": "object"}
+
+
+def test_resolve_plain_target_skips_nested_resolution():
+    """Test that targets with nothing to follow are returned without nested resolution."""
+    from cicerone.parse import parse_spec_from_dict
+    from cicerone.references import ReferenceResolver
+
+    spec_data = {
+        "openapi": "3.0.0",
+        "info": {"title": "Test", "version": "1.0.0"},
+        "paths": {},
+        "components": {"schemas": {"User": {"type": "object"}}},
+    }
+    spec = parse_spec_from_dict(spec_data)
+    resolver = ReferenceResolver(spec)
+
+    with mock.patch.object(ReferenceResolver, "_resolve_nested_references") as resolve_nested:
+        assert resolver.resolve_reference("#/info/title") == "Test"
+        resolver.resolve_reference("#/components/schemas/User", follow_nested=False)
+    resolve_nested.assert_not_called()
+    assert resolver._resolution_stack == []
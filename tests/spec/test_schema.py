@@ -2,6 +2,12 @@
 
 from __future__ import annotations
 
+import sys
+import typing
+
+import pytest
+import yaml
+
 from cicerone import spec as cicerone_spec
 
 
@@ -88,3 +94,52 @@ class TestSchema:
         schema = cicerone_spec.Schema.from_dict(data)
         str_repr = str(schema)
         assert "empty schema" in str_repr
+
+    def test_schema_deeply_nested_beyond_recursion_limit(self):
+        """Test that nesting deeper than the recursion limit still parses."""
+        depth = sys.getrecursionlimit() + 100
+        data: dict[str, typing.Any] = {"type": "string"}
+        for _ in range(depth):
+            data = {"type": "array", "items": data}
+        schema = cicerone_spec.Schema.from_dict(data)
+        for _ in range(depth):
+            assert schema.type == "array"
+            schema = schema.items
+        assert schema.type == "string"
+
+    def test_schema_nested_children_keep_their_order(self):
+        """Test that properties and composition lists keep their original order."""
+        data = {
+            "properties": {"b": {"type": "integer"}, "a": {"items": {"type": "string"}}},
+            "allOf": [{"title": "First"}, "not-a-schema", {"title": "Second"}],
+            "not": {"type": "null"},
+        }
+        schema = cicerone_spec.Schema.from_dict(data)
+        assert list(schema.properties) == ["b", "a"]
+        assert schema.properties["a"].items.type == "string"
+        assert [s.title for s in schema.all_of] == ["First", "Second"]
+        assert schema.not_.type == "null"
+
+    def test_schema_repeated_dicts_get_separate_schemas(self):
+        """Test that a dict appearing several times in the tree gets its own Schema at each position."""
+        address = {"type": "object", "required": ["street"], "properties": {"street": {"type": "string"}}}
+        data = {
+            "properties": {"home": address, "work": address},
+            "oneOf": [address, {"type": "null"}],
+        }
+        schema = cicerone_spec.Schema.from_dict(data)
+        assert schema.properties["home"] is not schema.properties["work"]
+        assert schema.one_of[0] is not schema.properties["home"]
+        assert schema.one_of[1].type == "null"
+        assert schema.properties["work"].properties["street"].type == "string"
+
+        # Changing the schema at one position leaves the others alone
+        schema.properties["home"].required.append("city")
+        assert schema.properties["work"].required == ["street"]
+        assert schema.one_of[0].required == ["street"]
+
+    def test_schema_recursive_yaml_alias_raises(self):
+        """Test that a schema dict containing itself raises instead of looping forever."""
+        data = yaml.safe_load("a: &x {properties: {self: *x}}")["a"]
+        with pytest.raises(ValueError, match="contains itself"):
+            cicerone_spec.Schema.from_dict(data)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from cicerone import spec as cicerone_spec
 
 
@@ -28,6 +30,11 @@ class TestServerVariable:
         assert var.enum == []
         assert var.description is None
 
+    def test_server_variable_missing_default(self):
+        """Test that a ServerVariable without a default is rejected."""
+        with pytest.raises(KeyError, match="default"):
+            cicerone_spec.ServerVariable.from_dict({"enum": ["v1", "v2"]})
+
 
 class TestServer:
     """Tests for Server model."""
@@ -40,6 +47,11 @@ class TestServer:
         assert server.description is None
         assert len(server.variables) == 0
 
+    def test_server_missing_url(self):
+        """Test that a Server without a url is rejected."""
+        with pytest.raises(KeyError, match="url"):
+            cicerone_spec.Server.from_dict({"description": "Production"})
+
     def test_server_with_description(self):
         """Test creating Server with description."""
         data = {
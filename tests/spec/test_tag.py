@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from cicerone import spec as cicerone_spec
 
 
@@ -25,6 +27,11 @@ class TestExternalDocumentation:
         assert ext_docs.url == "https://docs.example.com"
         assert ext_docs.description is None
 
+    def test_external_docs_missing_url(self):
+        """Test that ExternalDocumentation without a url is rejected."""
+        with pytest.raises(KeyError, match="url"):
+            cicerone_spec.ExternalDocumentation.from_dict({"description": "More info"})
+
 
 class TestTag:
     """Tests for Tag model."""
@@ -37,6 +44,11 @@ class TestTag:
         assert tag.description is None
         assert tag.external_docs is None
 
+    def test_tag_missing_name(self):
+        """Test that a Tag without a name is rejected."""
+        with pytest.raises(KeyError, match="name"):
+            cicerone_spec.Tag.from_dict({"description": "User operations"})
+
     def test_tag_with_description(self):
         """Test creating Tag with description."""
         data = {
@@ -62,6 +74,17 @@ class TestTag:
         assert tag.external_docs.url == "https://docs.example.com/users"
         assert tag.external_docs.description == "User documentation"
 
+    def test_tag_extensions_kept_as_extras(self):
+        """Test that vendor extensions are kept while externalDocs is not duplicated as an extra."""
+        data = {
+            "name": "users",
+            "x-display-name": "Users",
+            "externalDocs": {"url": "https://docs.example.com/users", "x-internal": True},
+        }
+        tag = cicerone_spec.Tag.from_dict(data)
+        assert tag.model_extra == {"x-display-name": "Users"}
+        assert tag.external_docs.model_extra == {"x-internal": True}
+
     def test_tag_str_representation(self):
         """Test __str__ method of Tag."""
         data = {"name": "users"}
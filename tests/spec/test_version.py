@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import pytest
+
 from cicerone import spec as cicerone_spec
+from cicerone.spec import version as spec_version
 
 
 class TestVersion:
@@ -30,3 +33,18 @@ class TestVersion:
         repr_str = repr(version)
         assert "Version" in repr_str
         assert "3.1.0" in repr_str
+
+    def test_parse_version_reuses_instances(self):
+        """Test that parse_version returns the same Version for the same string."""
+        version = spec_version.parse_version("3.0.3")
+        assert version is spec_version.parse_version("3.0.3")
+        assert (version.major, version.minor, version.patch) == (3, 0, 3)
+        assert spec_version.parse_version("3.1.0") is not version
+
+    def test_parse_version_shared_instance_is_read_only(self):
+        """Test that the shared Version from parse_version cannot be modified by one caller."""
+        version = spec_version.parse_version("3.0.0")
+        with pytest.raises(AttributeError):
+            version.major = 4
+        assert spec_version.parse_version("3.0.0") is version
+        assert version.major == 3
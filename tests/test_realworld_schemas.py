@@ -10,8 +10,10 @@ schemas without errors. The schemas contain various OpenAPI features including:
 import pathlib
 
 import pytest
+import yaml
 
 from cicerone import parse as cicerone_parse
+from cicerone import settings
 
 
 class TestRealWorldSchemas:
@@ -22,6 +24,20 @@ class TestRealWorldSchemas:
         """Return the path to the realworld fixtures directory."""
         return pathlib.Path(__file__).parent / "fixtures" / "realworld"
 
+    @pytest.mark.parametrize("filename", ["twilio.yaml", "ably.yaml", "spacetraders.yaml"])
+    def test_constructed_models_match_validated_models(
+        self, fixtures_dir: pathlib.Path, filename: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that building models without validation gives the same result as validating them."""
+        data = yaml.safe_load((fixtures_dir / filename).read_text())
+
+        monkeypatch.setattr(settings, "VALIDATE_MODELS", False)
+        constructed = cicerone_parse.parse_spec_from_dict(data)
+        monkeypatch.setattr(settings, "VALIDATE_MODELS", True)
+        validated = cicerone_parse.parse_spec_from_dict(data)
+
+        assert constructed.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+
     def test_parse_ably_schema(self, fixtures_dir: pathlib.Path) -> None:
         """Test parsing Ably.net Control API schema (OpenAPI 3.0.1)."""
         spec = cicerone_parse.parse_spec_from_file(fixtures_dir / "ably.yaml")